@@ -1,14 +1,22 @@
 #!/usr/bin/env python3
 
+import array
 import asyncio
 import copy
+import heapq
 import json
 import math
+import operator
 import os
+import re
 import sys
 import time
 from typing import Dict, List, Optional, Set, Tuple
-from collections import deque
+from bisect import bisect_left, bisect_right
+from collections import Counter, deque, namedtuple
+from functools import lru_cache, reduce
+from itertools import islice
+from types import MappingProxyType
 import select
 import struct
 
@@ -27,6 +35,12 @@ from rich import box
 from bleak.backends.bluezdbus.advertisement_monitor import OrPattern
 from bleak.assigned_numbers import AdvertisementDataType
 
+# orjson is optional - it speeds up history serialization when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # Helper functions
 def format_time_ago(seconds: float) -> str:
@@ -43,7 +57,9 @@ def format_time_ago(seconds: float) -> str:
 
 # Constants
 SETTINGS_FILE = "settings.json"
-HISTORY_FILE = "devices_history.json"
+HISTORY_FILE = "devices_history.jsonl"
+LEGACY_HISTORY_FILE = "devices_history.json"  # Pre-JSONL history, migrated on load
+HISTORY_COMPACTION_INTERVAL = 10  # Appending saves between full history rewrites
 AIRTAG_IDENTIFIERS = [
     "airtag",
     "find my",
@@ -51,7 +67,7 @@ AIRTAG_IDENTIFIERS = [
     "locate me",
     "findmy",
 ]  # Focused identifiers for AirTags and Find My devices
-FIND_MY_UUIDS = [
+FIND_MY_UUIDS = (
     "7DFC9000",
     "7DFC9001",
     "FD44",
@@ -68,13 +84,21 @@ FIND_MY_UUIDS = [
     "FD-44",
     "D0611E78",
     "9FA480E0",
-    "FD5A",
     "8667556C",
-]  # Apple and other tracker related UUIDs
+)  # Apple and other tracker related UUIDs
+# One-pass matchers over upper-cased UUIDs: any Find My UUID, the AirTag specific
+# UUIDs and the general Find My network UUIDs
+_FIND_MY_RE = re.compile("|".join(re.escape(uuid) for uuid in FIND_MY_UUIDS))
+_SPECIFIC_AIRTAG_RE = re.compile("7DFC900[01]")
+_FIND_MY_NETWORK_RE = re.compile("0000FD44|74278BDA")
+# Any AirTag identifier in a lower-cased device name, in a single scan
+_AIRTAG_NAME_RE = re.compile("|".join(re.escape(name) for name in AIRTAG_IDENTIFIERS))
 SCAN_INTERVAL = 0.5  # Scan interval in seconds (reduced for more frequent updates)
 DEFAULT_RSSI_AT_ONE_METER = -59  # Default RSSI at 1 meter for Bluetooth LE
 DEFAULT_DISTANCE_N_VALUE = 2.0  # Default environmental factor for distance calculation
 RSSI_HISTORY_SIZE = 20  # Increased number of RSSI readings to keep for better smoothing
+KALMAN_PROCESS_NOISE = 0.01  # Kalman filter process noise (Q) for RSSI smoothing
+KALMAN_MEASUREMENT_NOISE = 4.0  # Kalman filter measurement noise (R) for RSSI smoothing
 SCAN_MODE = "active"  # Can be "active" or "passive"
 SCAN_DURATION = 15.0  # Increased duration of each scan in seconds to catch more devices
 DETECTION_THRESHOLD = -95  # Lowered RSSI threshold for detecting more distant devices
@@ -113,7 +137,6 @@ COMPANY_IDENTIFIERS = {
     0x0157: "Anhui Huami",
     0x038F: "Xiaomi",
     0x02D0: "Tile",
-    0x0157: "Fitbit",
     0x012D: "Sony Ericsson",
     0x008A: "Tencent",
     0x000D: "Vivo",
@@ -153,6 +176,42 @@ COMPANY_IDENTIFIERS = {
     0x07BA: "Radbeacon",
     0x0183: "PEBBLEBEE",
 }
+_COMPANY_ID_SET = frozenset(COMPANY_IDENTIFIERS)  # Fast membership for the miss case
+
+# Vendor lookup by 24-bit MAC OUI - only well-known Apple prefixes
+_OUI_TO_VENDOR = MappingProxyType(
+    {
+        0xACDE48: "Apple",
+        0xA886DD: "Apple",
+        0xA483E7: "Apple",
+        0x7CD1C3: "Apple",
+        0xF0DCE2: "Apple",
+    }
+)
+
+# Exact manufacturer names that are very unlikely to be ambiguous in a device name
+_NAME_MANUFACTURERS = MappingProxyType(
+    {
+        "apple": "Apple",
+        "iphone": "Apple",
+        "macbook": "Apple",
+        "airpods": "Apple",
+        "airtag": "Apple",
+        "samsung": "Samsung",
+        "galaxy": "Samsung",
+        "huawei": "Huawei",
+        "xiaomi": "Xiaomi",
+        "sony": "Sony",
+        "bose": "Bose",
+        "fitbit": "Fitbit",
+        "garmin": "Garmin",
+        "tile": "Tile",
+    }
+)
+# Whole space-delimited words only, to avoid false positives
+_NAME_MANUFACTURER_RE = re.compile(
+    r"(?<!\S)(" + "|".join(_NAME_MANUFACTURERS) + r")(?!\S)"
+)
 
 # Device types based on services or characteristics
 DEVICE_TYPES = {
@@ -188,6 +247,30 @@ DEVICE_TYPES = {
     "0000FD5A": "Samsung Find",
 }
 
+# Short service UUIDs that map directly to a device type
+_SERVICE_TYPE_MAPPING = MappingProxyType(
+    {
+        "180D": "Heart Rate Monitor",
+        "1826": "Fitness Equipment",
+        "183A": "Environmental Sensor",
+        "181A": "Environmental Sensor",
+        "1819": "Location Tracker",
+        "FDCD": "Tile Tracker",
+        "FD5A": "Samsung SmartTag",
+    }
+)
+
+# Samsung device type byte (position 2) in Samsung manufacturer data
+_SAMSUNG_DEVICE_TYPES = MappingProxyType(
+    {
+        0x01: "Samsung Phone",
+        0x02: "Samsung Tablet",
+        0x03: "Samsung Watch",
+        0x04: "Samsung Buds",
+        0x05: "Samsung SmartTag",
+    }
+)
+
 # Apple specific service flags for device type identification
 APPLE_DEVICE_TYPES = {
     0x01: "iMac",
@@ -213,6 +296,17 @@ APPLE_DEVICE_TYPES = {
     0x15: "AirPods 3rd Gen",
 }
 
+# Apple device types and AirPods models indexed directly by their 4-bit nibble
+_APPLE_DEVICE_TYPE_BY_NIBBLE = tuple(APPLE_DEVICE_TYPES.get(i) for i in range(16))
+_AIRPODS_MODEL_BY_NIBBLE = (
+    None,
+    "AirPods 1st Gen",
+    "AirPods 2nd Gen",
+    "AirPods Pro",
+    "AirPods Max",
+    "AirPods 3rd Gen",
+) + (None,) * 10
+
 # Tracking device types
 TRACKING_DEVICE_TYPES = {
     "AIRTAG": {
@@ -248,6 +342,58 @@ TRACKING_DEVICE_TYPES = {
 # Add more confidence levels to tracker detection
 TRACKING_CONFIDENCE = {"CONFIRMED": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3, "UNLIKELY": 4}
 
+# Minimum evidence points for each tracker confidence level, thresholds adjusted based on research
+CONFIDENCE_THRESHOLDS = (
+    (9, "CONFIRMED"),  # Increased for definitive identification
+    (6, "HIGH"),  # Adjusted for high confidence
+    (4, "MEDIUM"),  # Adjusted for medium confidence
+    (1, "LOW"),
+)
+# Confidence level indexed by evidence points, capped at the highest threshold
+_CONFIDENCE_BY_POINTS = bytes(
+    next(
+        (
+            TRACKING_CONFIDENCE[level]
+            for threshold, level in CONFIDENCE_THRESHOLDS
+            if points >= threshold
+        ),
+        TRACKING_CONFIDENCE["UNLIKELY"],
+    )
+    for points in range(CONFIDENCE_THRESHOLDS[0][0] + 1)
+)
+
+# Device table styling per tracker confidence:
+# (name color, indicator, indicator style, probability range, probability color)
+CONFIDENCE_STYLE = {
+    TRACKING_CONFIDENCE["CONFIRMED"]: (
+        "bright_red",
+        " ⚠️",
+        "bold bright_red",
+        "95-100%",
+        "bright_red",
+    ),
+    TRACKING_CONFIDENCE["HIGH"]: ("red", " ⚠️", "bold red", "75-95%", "red"),
+    TRACKING_CONFIDENCE["MEDIUM"]: ("yellow", " 🔍", "bold yellow", "50-75%", "yellow"),
+    TRACKING_CONFIDENCE["LOW"]: ("blue", " ?", "bold blue", "25-50%", "blue"),
+}
+_DEFAULT_CONFIDENCE_STYLE = ("blue", None, None, "< 25%", "blue")
+
+# Ascending bin edges and their labels, looked up with bisect_right
+_RATE_BINS = (0.01, 0.05, 0.2, 0.5)  # Absolute rate of distance change (m/s)
+_RATE_LABELS = ("very slowly", "slowly", "steadily", "quickly", "very quickly")
+_QUALITY_RSSI_BINS = (-85, -75, -65, -50)  # Smoothed RSSI (dBm), inclusive lower edges
+_QUALITY_BY_RSSI_BIN = (20, 40, 60, 80, 100)  # Poor, fair, good, very good, excellent
+
+# Display color bins, looked up with bisect_left for higher-is-better readings
+# (strictly above an edge) and bisect_right for lower-is-better ones
+_RSSI_STYLE_BINS = (-85, -70)  # RSSI (dBm)
+_QUALITY_STYLE_BINS = (40, 70)  # Signal quality (%)
+_BATTERY_STYLE_BINS = (20, 50)  # Battery level (%)
+_STABILITY_STYLE_BINS = (3, 6)  # Signal stability (RSSI std dev)
+_DISTANCE_STYLE_BINS = (2, 5)  # Estimated distance (m)
+_RISING_STYLES = ("red", "yellow", "green")
+_FALLING_STYLES = ("green", "yellow", "red")
+
 # Updated FindMy data patterns based on Adam Catley's research
 FIND_MY_DATA_PATTERNS = [
     {"offset": 0, "value": 0x12, "mask": 0xFF},  # First byte 0x12
@@ -265,6 +411,12 @@ AIRTAG_STATUS_BITS = {
     0x02: "Play Sound",
     0x04: "Lost Mode",
 }
+# Union of all known status bits, so a single AND tells whether any are set
+AIRTAG_STATUS_MASK = reduce(operator.or_, AIRTAG_STATUS_BITS, 0)
+# Tracker confidence points for every status byte value, 4 per known status bit set
+_STATUS_BYTE_POINTS = bytes(
+    4 * bin(status_byte & AIRTAG_STATUS_MASK).count("1") for status_byte in range(256)
+)
 
 # Add AirTag status byte battery level indicators
 AIRTAG_BATTERY_STATUS = {
@@ -333,6 +485,54 @@ APPLE_ADV_TYPES = {
     0x12: "Find My",
 }
 
+# Apple payload header prefixes, matched with bytes.startswith
+_FIND_MY_PREFIX = b"\x12\x19"  # Registered Find My network broadcast
+_TRACKER_ADV_PREFIXES = (
+    _FIND_MY_PREFIX,
+    b"\x10",  # Nearby Action/Find My
+    b"\x0f",  # Nearby Interaction
+)
+
+# Tracker confidence points per Apple advertisement type (Adam Catley's research)
+_APPLE_ADV_TYPE_POINTS = MappingProxyType(
+    {
+        0x10: 3,  # Nearby Action/Find My
+        0x0F: 2,  # Nearby Interaction
+        0x07: 1,  # AirPods pattern, not tracker-specific
+        0x01: 1,  # AirPods pattern, not tracker-specific
+    }
+)
+
+# Apple payload interpretations keyed on the (first, second) header bytes, with
+# None as the second byte for types recognised by the first byte alone
+_APPLE_HEADER_DESCRIPTIONS = MappingProxyType(
+    {
+        (0x12, 0x19): "Apple Find My Network Advertisement",
+        (0x10, None): "Apple Watch Advertisement",
+        (0x07, 0x19): "AirPods Status Information",
+        (0x02, 0x15): "iBeacon Advertisement",
+    }
+)
+
+# Detail labels indexed by the decoded Apple status fields, built once at import
+_BATTERY_PERCENT = tuple(f"{level * 10}%" for level in range(16))  # 4-bit level
+_AIRPODS_CASE_STATUS = (None, "Case: Open", "Case: Closed", None)  # 2-bit lid state
+_AIRPODS_EAR_STATUS = (None, "In-Ear: Left", "In-Ear: Right", "In-Ear: Both")
+_WATCH_STATUS = (None, "Watch: Unlocked", "Watch: Active", "Watch: Unlocked, Active")
+
+# BlueZ advertisement monitor patterns for tracker broadcasts, used for passive scans in
+# AirTag-only mode so non-tracker advertisements are dropped before reaching Python
+TRACKER_OR_PATTERNS = [
+    # Apple (0x004C) registered Find My broadcast (0x12, 0x19)
+    OrPattern(0, AdvertisementDataType.MANUFACTURER_SPECIFIC_DATA, b"\x4c\x00\x12\x19"),
+    # Apple (0x004C) unregistered AirTag broadcast (0x07, 0x19)
+    OrPattern(0, AdvertisementDataType.MANUFACTURER_SPECIFIC_DATA, b"\x4c\x00\x07\x19"),
+    # Samsung SmartTag service data (FD5A)
+    OrPattern(0, AdvertisementDataType.SERVICE_DATA_UUID16, b"\x5a\xfd"),
+    # Find My network accessory service data (FD44)
+    OrPattern(0, AdvertisementDataType.SERVICE_DATA_UUID16, b"\x44\xfd"),
+]
+
 # Add specific byte positions for AirTag status in manufacturer data
 AIRTAG_BYTE_POSITIONS = {
     "status": 5,  # Status byte position in manufacturer data for AirTag status
@@ -344,7 +544,244 @@ AIRTAG_BYTE_POSITIONS = {
 }
 
 
+# AirTag data_patterns folded into one little-endian (needle, mask) word compare
+_AIRTAG_PATTERN_WIDTH = (
+    max(p["offset"] for p in TRACKING_DEVICE_TYPES["AIRTAG"]["data_patterns"]) + 1
+)
+_AIRTAG_MASK = 0
+_AIRTAG_NEEDLE = 0
+for _pattern in TRACKING_DEVICE_TYPES["AIRTAG"]["data_patterns"]:
+    _AIRTAG_MASK |= _pattern["mask"] << (8 * _pattern["offset"])
+    _AIRTAG_NEEDLE |= (_pattern["value"] & _pattern["mask"]) << (8 * _pattern["offset"])
+del _pattern
+
+# FIND_MY_DATA_PATTERNS as flat (offset, mask, value) tuples, checked in order
+_FIND_MY_DATA_CHECKS = tuple(
+    (p["offset"], p["mask"], p["value"]) for p in FIND_MY_DATA_PATTERNS
+)
+
+# Bytes 0, 1, 2, 5, 6 and 31 of a full 32-byte AirTag payload in one unpack
+_AIRTAG_STRUCT = struct.Struct("<BBB2xBB24xB")
+
+# Header fields of an Apple (0x004C) manufacturer data payload, parsed once per advertisement
+_ApplePayload = namedtuple(
+    "_ApplePayload",
+    "data length adv_type type_nibble status_byte battery_bits crypto_counter find_my "
+    "unregistered ibeacon airtag_pattern data_pattern_offset",
+)
+
+
+# Payloads repeat between rotations and across devices, so identical bytes are parsed once
+@lru_cache(maxsize=1024)
+def _parse_apple_payload(data) -> Optional[_ApplePayload]:
+    """Extract the Apple payload fields shared by the tracker detectors in a single pass"""
+    if data is None:
+        return None
+
+    length = len(data)
+    if length >= _AIRTAG_STRUCT.size:
+        adv_type, second_byte, type_byte, status_byte, battery_byte, crypto_counter = (
+            _AIRTAG_STRUCT.unpack_from(data)
+        )
+    else:
+        # Short payload: read the header bytes as one little-endian word and shift out
+        # the fields that are present
+        header = int.from_bytes(data[:7], "little")
+        adv_type = header & 0xFF if length > 0 else None
+        second_byte = header >> 8 & 0xFF if length > 1 else None
+        type_byte = header >> 16 & 0xFF if length > 2 else None
+        status_byte = header >> 40 & 0xFF if length > 5 else None
+        battery_byte = header >> 48 & 0xFF if length > 6 else None
+        crypto_counter = None
+
+    return _ApplePayload(
+        data=data,
+        length=length,
+        adv_type=adv_type,
+        type_nibble=type_byte & 0x0F if type_byte is not None else None,
+        status_byte=status_byte,
+        battery_bits=battery_byte & 0xF0 if battery_byte is not None else None,
+        # Crypto counter (position 31), only present in full-length payloads
+        crypto_counter=crypto_counter,
+        # Registered Find My network broadcast (0x12, 0x19)
+        find_my=adv_type == 0x12 and second_byte == 0x19,
+        # Unregistered AirTag broadcast (0x07, 0x19)
+        unregistered=adv_type == 0x07 and second_byte == 0x19,
+        # iBeacon frame (0x02, 0x15) with room for major/minor
+        ibeacon=length >= 23 and adv_type == 0x02 and second_byte == 0x15,
+        # Find My header with AirTag type nibble (0x12, 0x19, 0x?A)
+        airtag_pattern=length >= _AIRTAG_PATTERN_WIDTH
+        and int.from_bytes(data[:_AIRTAG_PATTERN_WIDTH], "little") & _AIRTAG_MASK
+        == _AIRTAG_NEEDLE,
+        # Offset of the first matching FIND_MY_DATA_PATTERNS entry, if any
+        data_pattern_offset=next(
+            (
+                offset
+                for offset, mask, value in _FIND_MY_DATA_CHECKS
+                if offset < length and (data[offset] & mask) == value
+            ),
+            None,
+        ),
+    )
+
+
+# Only a handful of distinct device types exist, so each is classified once
+@lru_cache(maxsize=None)
+def _device_type_rssi_correction(device_type: str) -> int:
+    """RSSI correction (dBm) for the distance model based on the device type"""
+    device_type = device_type.lower()
+    if device_type in ("airtag", "apple airtag"):
+        # AirTags tend to have stronger signals
+        return -2  # Subtract 2 dBm (signal appears stronger than it is)
+    elif "tag" in device_type or "tracker" in device_type:
+        # Other trackers may need different adjustments
+        return -1
+    elif "find my" in device_type:
+        # Find My devices may need a specific correction
+        return -3
+    return 0
+
+
+def _dump_json(data) -> bytes:
+    """Serialize settings to indented JSON bytes, using orjson when available"""
+    if orjson is not None:
+        # Settings are kept indented since users may read and edit the file
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+def _dump_json_line(entry) -> bytes:
+    """Serialize a history entry to a single compact JSON line"""
+    if orjson is not None:
+        # History airtag_status uses int keys, which stdlib json writes as strings
+        return orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+    return json.dumps(entry).encode() + b"\n"
+
+
+def _load_json(raw: bytes):
+    """Parse history or settings JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _rssi_int8(rssi) -> int:
+    """Clamp an RSSI reading (dBm) into the signed byte range of the history buffer"""
+    return max(-128, min(127, int(rssi)))
+
+
+def _bytes_values(data: Optional[Dict]) -> Dict:
+    """Return advertisement data with immutable bytes values, copying only if needed"""
+    if not data:
+        return {}
+    for value in data.values():
+        if type(value) is not bytes:
+            return {key: bytes(value) for key, value in data.items()}
+    return data
+
+
+def _device_sort_value(device: "Device", key: str):
+    """Return a device's value for one device table sort key, smallest first"""
+    if key == "track_prob":
+        # Lower values = higher confidence, non-trackers at bottom
+        return device.tracker_confidence if device.is_airtag else 999
+    elif key == "distance":
+        # Smaller values first
+        return device.distance if device.distance < 100 else 100
+    elif key == "last_seen":
+        # Negative value puts most recent first
+        return -device.last_seen
+    elif key == "rssi":
+        # Negative RSSI value makes stronger signals first
+        return -device.smooth_rssi
+    else:
+        # Negative value makes higher quality first
+        return -device.signal_quality
+
+
+def _sort_devices(devices, sort_keys: Tuple[str, ...]) -> List["Device"]:
+    """Sort devices by the given sort keys, computing each device's key tuple once"""
+    decorated = [
+        (tuple(_device_sort_value(device, key) for key in sort_keys), device)
+        for device in devices
+    ]
+    decorated.sort(key=operator.itemgetter(0))
+    return [device for _, device in decorated]
+
+
 class Device:
+    # Fixed attribute set: avoids a per-instance __dict__ and lets every optional
+    # field be initialized up front instead of probed with hasattr/getattr
+    __slots__ = (
+        "address",
+        "name",
+        "_name_lower",
+        "rssi",
+        "rssi_history",
+        "_rssi_sum",
+        "_rssi_sq_sum",
+        "_rssi_abs_diff_sum",
+        "_kf_x",
+        "_kf_p",
+        "_distance",
+        "_distance_key",
+        "_signal_stability",
+        "_signal_quality",
+        "_signal_quality_duration",
+        "manufacturer_data",
+        "service_data",
+        "service_uuids",
+        "_uuid_shorts",
+        "_uuids_upper",
+        "_service_data_upper",
+        "_oui",
+        "first_seen",
+        "last_seen",
+        "calibrated_n_value",
+        "calibrated_rssi_at_one_meter",
+        "is_new",
+        "previous_distance",
+        "distance_trend",
+        "last_trend_update",
+        # Advertisement timing and change tracking
+        "previous_seen",
+        "adv_interval",
+        "adv_interval_history",
+        "_adv_interval_sum",
+        "consistent_airtag_interval",
+        "prev_manufacturer_data",
+        "adv_changes",
+        "last_adv_change_time",
+        "prev_adv_change_time",
+        "adv_change_interval",
+        "matches_airtag_timing",
+        "last_advertisement_data",
+        "advertisement_changed_at",
+        "advertisement_changes",
+        "crypto_counter",
+        "crypto_counter_time",
+        "crypto_counter_matches",
+        # AirTag detection results
+        "apple_adv_type",
+        "airtag_status",
+        "battery_status",
+        "unregistered_airtag",
+        "find_my_uuid",
+        "find_my_service_data",
+        # Derived information
+        "_adv_signature",
+        "_apple_payload",
+        "_airtag_evidence",
+        "_confidence_points",
+        "_tracker_type",
+        "_show_new_label",
+        "is_airtag",
+        "tracker_confidence",
+        "manufacturer",
+        "device_type",
+        "device_details",
+    )
+
     def __init__(
         self,
         address: str,
@@ -357,28 +794,71 @@ class Device:
     ):
         self.address = address
         self.name = name or "Unknown"
+        # Names never change after discovery, so lower-case them once for the extractors
+        self._name_lower = self.name.lower()
         self.rssi = rssi
-        self.rssi_history = deque([rssi], maxlen=RSSI_HISTORY_SIZE)
-        self.manufacturer_data = manufacturer_data or {}
-        self.service_data = service_data or {}
-        self.service_uuids = service_uuids or []
-        self.first_seen = time.time()
-        self.last_seen = time.time()
-        self.is_airtag = self._check_if_airtag()
-        self.tracker_confidence = self._calculate_tracker_confidence()
+        # Recent RSSI readings as signed bytes (1 byte per sample), oldest first
+        self.rssi_history = array.array("b", [_rssi_int8(rssi)])
+        # Running integer sums over rssi_history for O(1) stability statistics
+        self._rssi_sum = self.rssi_history[0]
+        self._rssi_sq_sum = self.rssi_history[0] ** 2
+        self._rssi_abs_diff_sum = 0  # Sum of |change| between consecutive readings
+        # Scalar Kalman filter state for RSSI smoothing (estimate and error covariance)
+        self._kf_x = float(rssi)
+        self._kf_p = 1.0
+        # Distance estimate cached between RSSI readings, with the calibration it used
+        self._distance = None
+        self._distance_key = None
+        self._signal_stability = None  # Cached until the next RSSI reading
+        # Signal quality cached per RSSI reading, with the observed duration it used
+        self._signal_quality = None
+        self._signal_quality_duration = None
+        self.manufacturer_data = _bytes_values(manufacturer_data)
+        # Upper-cased service UUIDs and service data keys, recomputed only when they change
+        self._set_service_data(_bytes_values(service_data))
+        self._set_service_uuids(service_uuids or [])
+        self._oui = self._parse_oui(address)
+        self.first_seen = self.last_seen = time.time()
         self.calibrated_n_value = DEFAULT_DISTANCE_N_VALUE
         self.calibrated_rssi_at_one_meter = DEFAULT_RSSI_AT_ONE_METER
         self.is_new = is_new  # Flag to mark if this is a newly discovered device
 
         # For proximity tracking
         self.previous_distance = None
-        self.distance_trend = []  # Stores recent distance changes
-        self.last_trend_update = time.time()
-
-        # Extract extended information
-        self.manufacturer = self._extract_manufacturer()
-        self.device_type = self._extract_device_type()
-        self.device_details = self._extract_detailed_info()
+        # Stores recent distance changes (keep last 10 updates for better analysis)
+        self.distance_trend = deque(maxlen=10)
+        self.last_trend_update = self.first_seen
+
+        # Advertisement timing and change tracking (based on Adam Catley's AirTag research)
+        self.previous_seen = None
+        self.adv_interval = None
+        self.adv_interval_history = deque(maxlen=10)
+        self._adv_interval_sum = 0.0  # Running sum of adv_interval_history
+        self.consistent_airtag_interval = False
+        self.prev_manufacturer_data = None
+        self.adv_changes = 0
+        self.last_adv_change_time = None
+        self.prev_adv_change_time = None
+        self.adv_change_interval = None
+        self.matches_airtag_timing = False
+        self.last_advertisement_data = None
+        self.advertisement_changed_at = None
+        self.advertisement_changes = 0
+        self.crypto_counter = None
+        self.crypto_counter_time = None
+        self.crypto_counter_matches = False
+
+        # AirTag detection results, filled in by _check_if_airtag
+        self.apple_adv_type = None
+        self.airtag_status = {}
+        self.battery_status = None
+        self.unregistered_airtag = False
+        self.find_my_uuid = None
+        self.find_my_service_data = None
+
+        # Detect trackers and extract extended information
+        self._adv_signature = self._advertisement_signature()
+        self._refresh_extracted_info()
 
     def update(
         self,
@@ -387,186 +867,228 @@ class Device:
         service_data: Optional[Dict] = None,
         service_uuids: Optional[List] = None,
         is_new: Optional[bool] = None,
+        now: Optional[float] = None,
     ):
+        # One timestamp for the whole advertisement
+        if now is None:
+            now = time.time()
+
         # Store previous advertisement time for calculating interval
         # (Used for AirTag detection based on Adam Catley's research on 2s advertisement interval)
-        self.previous_seen = getattr(self, "last_seen", time.time())
+        self.previous_seen = self.last_seen
 
         # Store previous manufacturer data to detect changes
         if 76 in self.manufacturer_data:  # Apple's company identifier
             # Store previous data before updating
-            if not hasattr(self, "prev_manufacturer_data"):
+            if self.prev_manufacturer_data is None:
                 self.prev_manufacturer_data = {}
-            self.prev_manufacturer_data[76] = bytes(self.manufacturer_data[76])
+            self.prev_manufacturer_data[76] = self.manufacturer_data[76]
 
         self.rssi = rssi
-        self.rssi_history.append(rssi)
+        # Bounded history: drop the oldest sample once full (a 20-byte memmove),
+        # keeping the running sums in step
+        rssi_history = self.rssi_history
+        if len(rssi_history) >= RSSI_HISTORY_SIZE:
+            oldest = rssi_history[0]
+            self._rssi_sum -= oldest
+            self._rssi_sq_sum -= oldest * oldest
+            self._rssi_abs_diff_sum -= abs(rssi_history[1] - oldest)
+            del rssi_history[0]
+        sample = _rssi_int8(rssi)
+        self._rssi_sum += sample
+        self._rssi_sq_sum += sample * sample
+        self._rssi_abs_diff_sum += abs(sample - rssi_history[-1])
+        rssi_history.append(sample)
+
+        # Incremental Kalman update of the smoothed RSSI (O(1) per advertisement)
+        kalman_gain = self._kf_p / (self._kf_p + KALMAN_MEASUREMENT_NOISE)
+        self._kf_x += kalman_gain * (rssi - self._kf_x)
+        self._kf_p = (1 - kalman_gain) * self._kf_p + KALMAN_PROCESS_NOISE
+        # New reading, estimate the distance and signal stability and quality again
+        self._distance = None
+        self._signal_stability = None
+        self._signal_quality = None
 
         # Check for manufacturer data changes (for detecting AirTag 15-minute update cycle)
+        manufacturer_data = _bytes_values(manufacturer_data)
         if manufacturer_data:
             # Check for changes in Apple's manufacturer data
             if (
                 76 in manufacturer_data
-                and hasattr(self, "prev_manufacturer_data")
+                and self.prev_manufacturer_data is not None
                 and 76 in self.prev_manufacturer_data
             ):
                 # Compare data to detect changes in advertisement
-                if bytes(manufacturer_data[76]) != self.prev_manufacturer_data[76]:
+                if manufacturer_data[76] != self.prev_manufacturer_data[76]:
                     # Record time of change and update counter
-                    current_time = time.time()
-                    self.last_adv_change_time = current_time
+                    self.last_adv_change_time = now
 
                     # Calculate time since last change if available
-                    if hasattr(self, "prev_adv_change_time"):
-                        change_interval = current_time - self.prev_adv_change_time
+                    if self.prev_adv_change_time is not None:
+                        change_interval = now - self.prev_adv_change_time
                         # Check if this matches the 15-minute cycle from Adam's research
                         if 840 <= change_interval <= 960:  # 14-16 minutes in seconds
                             self.matches_airtag_timing = True
                         self.adv_change_interval = change_interval
 
                     # Update change history
-                    self.prev_adv_change_time = current_time
-                    self.adv_changes = getattr(self, "adv_changes", 0) + 1
+                    self.prev_adv_change_time = now
+                    self.adv_changes += 1
 
             # Now update the actual data
             self.manufacturer_data = manufacturer_data
 
         if service_data:
-            self.service_data = service_data
-        if service_uuids:
-            self.service_uuids = service_uuids
+            self._set_service_data(_bytes_values(service_data))
+        if service_uuids and service_uuids != self.service_uuids:
+            self._set_service_uuids(service_uuids)
         if is_new is not None:
             self.is_new = is_new
 
-        self.last_seen = time.time()
+        self.last_seen = now
 
         # Calculate advertisement interval (Adam's research says AirTags use ~2s when separated)
         self.adv_interval = self.last_seen - self.previous_seen
-        # Build up history of intervals to detect consistent patterns
-        if not hasattr(self, "adv_interval_history"):
-            self.adv_interval_history = deque(maxlen=10)
-        self.adv_interval_history.append(self.adv_interval)
+        # Build up history of intervals to detect consistent patterns,
+        # keeping a running sum so the average stays O(1)
+        history = self.adv_interval_history
+        if len(history) == history.maxlen:
+            self._adv_interval_sum -= history[0]
+        history.append(self.adv_interval)
+        self._adv_interval_sum += self.adv_interval
 
         # Analyze if device shows consistent ~2s advertisement interval like AirTags
-        if len(self.adv_interval_history) >= 5:
+        if len(history) >= 5:
             # Calculate average and standard deviation
-            avg_interval = sum(self.adv_interval_history) / len(
-                self.adv_interval_history
-            )
+            avg_interval = self._adv_interval_sum / len(history)
             # Check if average is close to AirTag's expected 2s and relatively stable
             if 1.8 <= avg_interval <= 2.2:
                 self.consistent_airtag_interval = True
 
-        # Recalculate tracker detection with new data
+        # Recalculate tracker detection and extracted information with new data,
+        # skipping the payload parse when only the RSSI changed since the last advertisement
+        signature = self._advertisement_signature()
+        payload_changed = signature != self._adv_signature
+        self._adv_signature = signature
+        self._refresh_extracted_info(payload_changed, now)
+
+        # Update proximity trend if this device has been tracked before
+        if self.previous_distance is not None:
+            self.update_proximity_trend(now)
+
+    def _set_service_uuids(self, service_uuids: List):
+        """Store service UUIDs along with their upper-cased and short (last 4 digit) forms"""
+        self.service_uuids = service_uuids
+        self._uuids_upper = tuple(uuid.upper() for uuid in service_uuids)
+        self._uuid_shorts = tuple(uuid[-4:] for uuid in self._uuids_upper)
+
+    def _set_service_data(self, service_data: Dict):
+        """Store service data along with (upper-cased UUID, data) pairs for matching"""
+        self.service_data = service_data
+        self._service_data_upper = tuple(
+            (uuid.upper(), data) for uuid, data in service_data.items()
+        )
+
+    def _advertisement_signature(self) -> Tuple:
+        """Snapshot of the advertisement content used to detect payload changes between updates"""
+        return (
+            tuple(self.manufacturer_data.items()),
+            tuple(self.service_data.items()),
+            tuple(self.service_uuids),
+        )
+
+    def _refresh_extracted_info(
+        self, payload_changed: bool = True, now: Optional[float] = None
+    ):
+        """Parse the Apple payload once and re-derive all tracker and device information from it
+
+        When the payload is unchanged only the timing and RSSI dependent tracker checks are rerun.
+        """
+        if payload_changed:
+            self._apple_payload = _parse_apple_payload(self.manufacturer_data.get(76))
+            self.manufacturer = self._extract_manufacturer()
+            self.device_type = self._extract_device_type()
+            self._airtag_evidence = self._collect_airtag_evidence()
+            self._confidence_points = None  # Scored on demand, trackers only
+
+        # Tracker detection also depends on advertisement timing and RSSI history
         self.is_airtag = self._check_if_airtag()
         self.tracker_confidence = self._calculate_tracker_confidence()
 
-        # Update extracted information
-        self.manufacturer = self._extract_manufacturer()
-        self.device_type = self._extract_device_type()
-        self.device_details = self._extract_detailed_info()
+        # Details only change with the payload or when the NEW label appears or expires
+        if now is None:
+            now = time.time()
+        show_new_label = self.is_new and now - self.first_seen <= NEW_DEVICE_TIMEOUT
+        if payload_changed or show_new_label != self._show_new_label:
+            self._show_new_label = show_new_label
+            self.device_details = self._extract_detailed_info(now)
 
-        # Update proximity trend if this device has been tracked before
-        if self.previous_distance is not None:
-            self.update_proximity_trend()
+        # The tracker type is identified again on the next request
+        self._tracker_type = None
 
     def _extract_manufacturer(self) -> str:
         """Extract manufacturer information from BLE advertisement data"""
         # First check for official manufacturer ID (most reliable)
-        for company_id in self.manufacturer_data:
-            if company_id in COMPANY_IDENTIFIERS:
-                return COMPANY_IDENTIFIERS[company_id]
+        known_ids = self.manufacturer_data.keys() & _COMPANY_ID_SET
+        if known_ids:
+            # Keep advertisement order when several known IDs are present
+            for company_id in self.manufacturer_data:
+                if company_id in known_ids:
+                    return COMPANY_IDENTIFIERS[company_id]
 
         # Be very conservative with name-based identification
         if self.name:
-            name_lower = self.name.lower()
-
-            # Only use exact manufacturer names that are very unlikely to be ambiguous
-            exact_manufacturer_matches = {
-                "apple": "Apple",
-                "iphone": "Apple",
-                "macbook": "Apple",
-                "airpods": "Apple",
-                "airtag": "Apple",
-                "samsung": "Samsung",
-                "galaxy": "Samsung",
-                "huawei": "Huawei",
-                "xiaomi": "Xiaomi",
-                "sony": "Sony",
-                "bose": "Bose",
-                "fitbit": "Fitbit",
-                "garmin": "Garmin",
-                "tile": "Tile",
-            }
+            name_lower = self._name_lower
 
             # Check for exact name matches only
-            for keyword, manufacturer in exact_manufacturer_matches.items():
-                # Use exact word boundaries to avoid false positives
-                if keyword == name_lower or f" {keyword} " in f" {name_lower} ":
-                    return manufacturer
+            match = _NAME_MANUFACTURER_RE.search(name_lower)
+            if match:
+                return _NAME_MANUFACTURERS[match.group(1)]
 
             # For devices with clear model designations
-            if (
-                name_lower.startswith("iphone")
-                or name_lower.startswith("ipad")
-                or name_lower.startswith("macbook")
-            ):
+            if name_lower.startswith(("iphone", "ipad", "macbook")):
                 return "Apple"
 
         # Check MAC address OUI (first three bytes) - only for well-known Apple prefixes
-        if ":" in self.address:
-            apple_ouis = ["ac:de:48", "a8:86:dd", "a4:83:e7", "7c:d1:c3", "f0:dc:e2"]
-            address_start = self.address.lower()[:8]  # Get first 3 bytes with colons
-            if any(address_start.startswith(oui) for oui in apple_ouis):
-                return "Apple"
-
         # Default to Unknown if we don't have high confidence
-        return "Unknown"
+        return _OUI_TO_VENDOR.get(self._oui, "Unknown")
+
+    @staticmethod
+    def _parse_oui(address: str) -> Optional[int]:
+        """Return the 24-bit OUI of a colon-separated MAC address, or None"""
+        if ":" not in address:
+            return None
+        try:
+            return int(address[:8].replace(":", ""), 16)
+        except ValueError:
+            return None
 
     def _extract_device_type(self) -> str:
         """Extract device type from BLE advertisement data"""
         device_type = "Unknown"
 
         # Start with the most reliable signals: Apple device type flags
-        if 76 in self.manufacturer_data and len(self.manufacturer_data[76]) > 2:
-            apple_type_byte = self.manufacturer_data[76][2] & 0x0F
-            if apple_type_byte in APPLE_DEVICE_TYPES:
+        apple = self._apple_payload
+        if apple is not None and apple.type_nibble is not None:
+            apple_type = _APPLE_DEVICE_TYPE_BY_NIBBLE[apple.type_nibble]
+            if apple_type:
                 # This is very reliable - use it
-                device_type = APPLE_DEVICE_TYPES[apple_type_byte]
+                device_type = apple_type
 
                 # For AirPods, get more specific model if available
-                if apple_type_byte == 0x09 and len(self.manufacturer_data[76]) >= 4:
-                    model_byte = self.manufacturer_data[76][3] & 0x0F
-                    airpod_types = {
-                        0x01: "AirPods 1st Gen",
-                        0x02: "AirPods 2nd Gen",
-                        0x03: "AirPods Pro",
-                        0x04: "AirPods Max",
-                        0x05: "AirPods 3rd Gen",
-                    }
-                    if model_byte in airpod_types:
-                        return airpod_types[model_byte]
+                if apple.type_nibble == 0x09 and apple.length >= 4:
+                    airpods_model = _AIRPODS_MODEL_BY_NIBBLE[apple.data[3] & 0x0F]
+                    if airpods_model:
+                        return airpods_model
 
         # Check service UUIDs for known device types (reliable for standardized services)
-        if self.service_uuids:
-            service_type_mapping = {
-                "180D": "Heart Rate Monitor",
-                "1826": "Fitness Equipment",
-                "183A": "Environmental Sensor",
-                "181A": "Environmental Sensor",
-                "1819": "Location Tracker",
-                "FDCD": "Tile Tracker",
-                "FD5A": "Samsung SmartTag",
-            }
-
-            for uuid in self.service_uuids:
-                uuid_short = uuid[-4:].upper()
-                if uuid_short in service_type_mapping:
-                    return service_type_mapping[uuid_short]
+        for uuid_short in self._uuid_shorts:
+            if uuid_short in _SERVICE_TYPE_MAPPING:
+                return _SERVICE_TYPE_MAPPING[uuid_short]
 
         # Name-based identification (only for very specific, clear device names)
         if self.name:
-            name_lower = self.name.lower()
+            name_lower = self._name_lower
 
             # Precise Apple product identification
             if name_lower == "airtag" or (
@@ -600,24 +1122,12 @@ class Device:
 
             # Samsung devices with known format
             if company_id == 0x0075 and len(data) > 3:
-                samsung_device_types = {
-                    0x01: "Samsung Phone",
-                    0x02: "Samsung Tablet",
-                    0x03: "Samsung Watch",
-                    0x04: "Samsung Buds",
-                    0x05: "Samsung SmartTag",
-                }
-                device_byte = data[2] if len(data) > 2 else 0
-                if device_byte in samsung_device_types:
-                    return samsung_device_types[device_byte]
+                samsung_type = _SAMSUNG_DEVICE_TYPES.get(data[2])
+                if samsung_type:
+                    return samsung_type
 
             # Apple iBeacon format
-            if (
-                company_id == 0x004C
-                and len(data) >= 23
-                and data[0] == 0x02
-                and data[1] == 0x15
-            ):
+            if company_id == 0x004C and apple.ibeacon:
                 return "iBeacon"
 
             # Tile tracker
@@ -635,263 +1145,275 @@ class Device:
         # Return a generic BLE device type
         return "BLE Device"
 
-    def _extract_detailed_info(self) -> str:
+    def _extract_detailed_info(self, now: Optional[float] = None) -> str:
         """Extract detailed information from BLE advertisement data"""
         details = []
+        add = details.append  # Bound once, most branches below add a single entry
+        if now is None:
+            now = time.time()
 
         # Check if this is a new device AND it's within the timeout period
         # Only show NEW label for specified timeout period
-        if (
-            getattr(self, "is_new", False)
-            and time.time() - getattr(self, "first_seen", time.time())
-            <= NEW_DEVICE_TIMEOUT
-        ):
-            details.append("NEW DEVICE")
+        if self.is_new and now - self.first_seen <= NEW_DEVICE_TIMEOUT:
+            add("NEW DEVICE")
 
         # Don't add tracking device info to details anymore - we show this in the Track Prob column
 
         # Parse Apple specific data
-        if 76 in self.manufacturer_data:
-            apple_data = self.manufacturer_data[76]
+        apple = self._apple_payload
+        if apple is not None:
+            apple_data = apple.data
 
             # Try to extract Apple model details based on Adam Catley's AirTag research
-            if len(apple_data) > 5:
+            if apple.length > 5:
                 try:
                     # AirTag protocol detection
                     # Registered AirTag/Find My protocol (0x12, 0x19)
-                    if apple_data[0] == 0x12 and apple_data[1] == 0x19:
-                        details.append("Find My Network")
+                    if apple.find_my:
+                        add("Find My Network")
                     # Unregistered AirTag detection (0x07, 0x19) per new research
-                    elif apple_data[0] == 0x07 and apple_data[1] == 0x19:
-                        details.append("Unregistered AirTag")
+                    elif apple.unregistered:
+                        add("Unregistered AirTag")
 
                         # Check for AirTag specific identifiers
-                        if len(apple_data) > 3 and apple_data[2] & 0x0F == 0x0A:
-                            details.append("AirTag")
+                        if apple.type_nibble == 0x0A:
+                            add("AirTag")
 
                         # Track advertisement data changes - might indicate 15 minute update cycle
-                        if hasattr(self, "last_advertisement_data"):
+                        if self.last_advertisement_data is not None:
                             if (
                                 self.manufacturer_data[76]
                                 != self.last_advertisement_data
                             ):
-                                self.advertisement_changed_at = time.time()
-                                self.advertisement_changes = (
-                                    getattr(self, "advertisement_changes", 0) + 1
-                                )
+                                self.advertisement_changed_at = now
+                                self.advertisement_changes += 1
                         # Store current data for next comparison
-                        self.last_advertisement_data = bytes(self.manufacturer_data[76])
+                        self.last_advertisement_data = self.manufacturer_data[76]
 
                         # Try to extract AirTag status bits if available (position 5 according to Adam's research)
-                        if len(apple_data) >= 6:
-                            status_byte = apple_data[5]
-                            status_details = []
+                        if apple.status_byte is not None:
+                            status_byte = apple.status_byte
 
+                            # Add status bits information, each as its own entry of the
+                            # " | " separated details rather than a pre-joined string
                             if status_byte & 0x01:
-                                status_details.append("Separated")
+                                add("Separated")
                             if status_byte & 0x02:
-                                status_details.append("Play Sound")
+                                add("Play Sound")
                             if status_byte & 0x04:
-                                status_details.append("Lost Mode")
-
-                            # Add status bits information
-                            if status_details:
-                                details.append(" | ".join(status_details))
+                                add("Lost Mode")
 
                             # Add status byte for advanced users if non-zero
                             if status_byte > 0:
-                                details.append(f"Status: 0x{status_byte:02X}")
+                                add(f"Status: 0x{status_byte:02X}")
 
                         # Check for battery status at position 6 (per new research)
-                        if len(apple_data) >= 7:
-                            battery_status_byte = apple_data[6]
-                            battery_value = battery_status_byte & 0xF0
-
-                            # Check against known battery status values from new research
-                            if battery_value == 0x10:
-                                details.append("Battery Full")
-                            elif battery_value == 0x50:
-                                details.append("Battery Medium")
-                            elif battery_value == 0x90:
-                                details.append("Battery Low")
-                            elif battery_value == 0xD0:
-                                details.append("Battery Very Low")
+                        battery_status = AIRTAG_BATTERY_STATUS.get(apple.battery_bits)
+                        if battery_status is not None:
+                            add(battery_status)
 
                         # Check for crypto counter (position 31) which changes every 15 minutes
-                        if len(apple_data) >= 32:
+                        if apple.crypto_counter is not None:
                             # Store the crypto counter for change detection
-                            if not hasattr(self, "crypto_counter"):
-                                self.crypto_counter = apple_data[31]
-                                self.crypto_counter_time = time.time()
-                            elif self.crypto_counter != apple_data[31]:
+                            if self.crypto_counter is None:
+                                self.crypto_counter = apple.crypto_counter
+                                self.crypto_counter_time = now
+                            elif self.crypto_counter != apple.crypto_counter:
                                 # Calculate time since last change
-                                time_diff = time.time() - self.crypto_counter_time
+                                time_diff = now - self.crypto_counter_time
                                 # Check if it's around 15 minutes (14-16 min range)
                                 if 840 <= time_diff <= 960:
-                                    details.append("15min Counter Change")
+                                    add("15min Counter Change")
                                     self.crypto_counter_matches = True
                                 # Update for next check
-                                self.crypto_counter = apple_data[31]
-                                self.crypto_counter_time = time.time()
+                                self.crypto_counter = apple.crypto_counter
+                                self.crypto_counter_time = now
 
                             # Show the crypto counter value (helpful for tracking changes)
-                            details.append(f"Counter: 0x{apple_data[31]:02X}")
+                            add(f"Counter: 0x{apple.crypto_counter:02X}")
 
                         # Add timing information if we have it
-                        if (
-                            hasattr(self, "advertisement_changes")
-                            and self.advertisement_changes > 0
-                        ):
-                            details.append(f"Adv Changes: {self.advertisement_changes}")
+                        if self.advertisement_changes > 0:
+                            add(f"Adv Changes: {self.advertisement_changes}")
 
                     # AirPods battery levels
-                    elif len(apple_data) >= 13 and (
-                        apple_data[0] == 0x07 or apple_data[0] == 0x01
-                    ):
+                    elif len(apple_data) >= 13 and apple.adv_type in (0x07, 0x01):
                         if apple_data[1] == 0x19:
                             left_battery = apple_data[6] & 0x0F
                             right_battery = (apple_data[6] & 0xF0) >> 4
                             case_battery = apple_data[7] & 0x0F
                             if left_battery < 0x0F and right_battery < 0x0F:
-                                details.append(
-                                    f"Batt: L:{left_battery*10}% R:{right_battery*10}% C:{case_battery*10}%"
+                                add(
+                                    f"Batt: L:{_BATTERY_PERCENT[left_battery]} "
+                                    f"R:{_BATTERY_PERCENT[right_battery]} "
+                                    f"C:{_BATTERY_PERCENT[case_battery]}"
                                 )
 
                             # Extract AirPods case status
-                            case_status = apple_data[8] & 0x03
-                            if case_status == 0x01:
-                                details.append("Case: Open")
-                            elif case_status == 0x02:
-                                details.append("Case: Closed")
+                            case_status = _AIRPODS_CASE_STATUS[apple_data[8] & 0x03]
+                            if case_status:
+                                add(case_status)
 
                             # Extract in-ear detection status if available
                             if len(apple_data) >= 11:
-                                ear_status = apple_data[10] & 0x03
-                                if ear_status == 0x01:
-                                    details.append("In-Ear: Left")
-                                elif ear_status == 0x02:
-                                    details.append("In-Ear: Right")
-                                elif ear_status == 0x03:
-                                    details.append("In-Ear: Both")
+                                ear_status = _AIRPODS_EAR_STATUS[apple_data[10] & 0x03]
+                                if ear_status:
+                                    add(ear_status)
 
                     # Apple Watch info
-                    elif apple_data[0] == 0x10 and len(apple_data) >= 8:
-                        watch_status = apple_data[6]
-                        status_info = []
-                        if watch_status & 0x01:
-                            status_info.append("Unlocked")
-                        if watch_status & 0x02:
-                            status_info.append("Active")
-                        if status_info:
-                            details.append(f"Watch: {', '.join(status_info)}")
+                    elif apple.adv_type == 0x10 and len(apple_data) >= 8:
+                        # Unlocked (0x01) and Active (0x02) flags
+                        watch_status = _WATCH_STATUS[apple_data[6] & 0x03]
+                        if watch_status:
+                            add(watch_status)
 
                         watch_battery = apple_data[7] & 0x0F
                         if watch_battery <= 10:
-                            details.append(f"Battery: {watch_battery*10}%")
+                            add(f"Battery: {_BATTERY_PERCENT[watch_battery]}")
 
                         # iPhone/iPad info
-                    elif apple_data[0] == 0x0C and len(apple_data) >= 5:
+                    elif apple.adv_type == 0x0C and len(apple_data) >= 5:
                         phone_status = apple_data[4]
                         if phone_status & 0x01:
-                            details.append("Status: Unlocked")
+                            add("Status: Unlocked")
                 except:
                     pass
 
         # Extract battery information - prioritize this
+        # (service data values are bytes, so the length guards cover every read below)
         battery_info = None
-        for uuid, data in self.service_data.items():
-            if "180F" in uuid.upper():  # Battery Service
-                try:
-                    if len(data) >= 1:
-                        battery = data[0]
-                        battery_info = f"Battery: {battery}%"
-                except:
-                    pass
+        for uuid_upper, data in self._service_data_upper:
+            if "180F" in uuid_upper and data:  # Battery Service
+                battery_info = f"Battery: {data[0]}%"
 
         if battery_info:
-            details.append(battery_info)
+            add(battery_info)
 
         # Extract service data details
-        for uuid, data in self.service_data.items():
-            if "1809" in uuid.upper():  # Health Thermometer
-                try:
-                    if len(data) >= 2:
-                        temp = struct.unpack("<h", data[:2])[0] / 100.0
-                        details.append(f"Temp: {temp}°C")
-                except:
-                    pass
+        for uuid_upper, data in self._service_data_upper:
+            if "1809" in uuid_upper:  # Health Thermometer
+                if len(data) >= 2:
+                    temp = struct.unpack_from("<h", data)[0] / 100.0
+                    add(f"Temp: {temp}°C")
 
-            elif "2A6D" in uuid.upper() or "2A6E" in uuid.upper():  # Pressure
-                try:
-                    if len(data) >= 4:
-                        pressure = struct.unpack("<f", data[:4])[0]
-                        details.append(f"Pressure: {pressure} Pa")
-                except:
-                    pass
+            elif "2A6D" in uuid_upper or "2A6E" in uuid_upper:  # Pressure
+                if len(data) >= 4:
+                    pressure = struct.unpack_from("<f", data)[0]
+                    add(f"Pressure: {pressure} Pa")
 
-            elif "1826" in uuid.upper():  # Fitness Machine Service
-                try:
-                    if len(data) >= 2:
-                        # Various fitness machine data could be extracted here
-                        details.append("Fitness Data")
-                except:
-                    pass
+            elif "1826" in uuid_upper:  # Fitness Machine Service
+                if len(data) >= 2:
+                    # Various fitness machine data could be extracted here
+                    add("Fitness Data")
 
-            elif "FD5A" in uuid.upper():  # Samsung SmartTag
-                details.append("SmartTag")
+            elif "FD5A" in uuid_upper:  # Samsung SmartTag
+                add("SmartTag")
 
-            elif "FDCD" in uuid.upper():  # Tile
-                details.append("Tile Tracker")
+            elif "FDCD" in uuid_upper:  # Tile
+                add("Tile Tracker")
 
         # Check for iBeacon data pattern
-        for company_id, data in self.manufacturer_data.items():
-            if (
-                company_id == 0x004C
-                and len(data) >= 23
-                and data[0] == 0x02
-                and data[1] == 0x15
-            ):
-                # iBeacon format detected
-                try:
-                    # Extract Major and Minor values
-                    major = (data[18] << 8) | data[19]
-                    minor = (data[20] << 8) | data[21]
-                    details.append(f"iBeacon: {major}.{minor}")
-                except:
-                    details.append("iBeacon")
+        if apple is not None and apple.ibeacon:
+            # iBeacon format detected
+            data = apple.data
+            try:
+                # Extract big-endian Major and Minor values in one unpack
+                major, minor = struct.unpack_from(">HH", data, 18)
+                add(f"iBeacon: {major}.{minor}")
+            except struct.error:
+                add("iBeacon")
 
         # Add tx power if available and not already showing battery
-        if (
-            "180A" in [uuid[-4:].upper() for uuid in self.service_uuids]
-            and not battery_info
-        ):
+        if "180A" in self._uuid_shorts and not battery_info:
             # Only show Tx power if we don't have battery info
-            details.append("Tx Power: Standard")
+            add("Tx Power: Standard")
 
         # Add service UUIDs if present
-        if self.service_uuids and len(self.service_uuids) > 0:
-            known_services = []
-            for uuid in self.service_uuids:
-                uuid_short = uuid[-4:].upper()
-                if uuid_short in DEVICE_TYPES:
-                    known_services.append(DEVICE_TYPES[uuid_short])
-
-            if known_services:
-                services_str = ", ".join(
-                    known_services[:2]
-                )  # Limit to first 2 services
-                if len(known_services) > 2:
-                    services_str += f" +{len(known_services)-2}"
-                details.append(f"Services: {services_str}")
-
-        # Make string from details
-        if details:
-            return " | ".join(details)
-        return ""
+        if self._uuid_shorts:
+            # Name the first 2 known services and only count the rest
+            shown_services = []
+            extra_services = 0
+            for uuid_short in self._uuid_shorts:
+                service_name = DEVICE_TYPES.get(uuid_short)
+                if service_name is None:
+                    continue
+                if len(shown_services) < 2:
+                    shown_services.append(service_name)
+                else:
+                    extra_services += 1
+
+            if shown_services:
+                services_str = ", ".join(shown_services)
+                if extra_services:
+                    services_str += f" +{extra_services}"
+                add(f"Services: {services_str}")
+
+        # Make string from details (empty when there are none)
+        return " | ".join(details)
 
     def _check_if_airtag(self) -> bool:
         """Check if device is potentially an AirTag or other tracking device with enhanced detection based on
         Adam Catley's research on AirTag reverse engineering"""
+        evidence = self._airtag_evidence
+        apple_manufacturer = evidence["apple_manufacturer"]
+
+        # Apply decision rules for classification based on Adam Catley's research,
+        # content-only rules first so timing is only analysed when they don't decide
+
+        # Definite AirTag (extremely high confidence)
+        if apple_manufacturer and (
+            # AirTag specific pattern mentioned in Adam's research - highest confidence
+            evidence["airtag_pattern"]
+            # Unregistered AirTag pattern
+            or evidence["unregistered_airtag"]
+            # Find My pattern with status bits, known UUIDs or battery status indicators
+            or (
+                evidence["find_my_pattern"]
+                and (
+                    evidence["status_bits"]
+                    or evidence["known_uuid"]
+                    or evidence["battery_status"]
+                )
+            )
+            # Old but reliable pattern according to Adam's research
+            or (evidence["nearby_interaction"] and evidence["known_uuid"])
+        ):
+            return True
+
+        # High confidence Find My device (not necessarily an AirTag)
+        if (
+            apple_manufacturer
+            and (
+                evidence["find_my_pattern"]
+                or evidence["known_uuid"]
+                or evidence["service_data"]
+            )
+        ) or (evidence["name_match"] and evidence["known_uuid"]):
+            return True
+
+        if not apple_manufacturer:
+            # For non-Apple manufacturers, require stronger evidence for trackers
+            return evidence["known_tracker"]
+
+        # Check for specific advertisement timing patterns. The ~2s interval of
+        # registered AirTags only counts together with the Find My pattern, which has
+        # already matched above, so only the unregistered AirTag rate is left to check
+        if self.previous_seen:
+            adv_interval = self.last_seen - self.previous_seen
+            # Unregistered AirTags advertise much more frequently (~33ms)
+            if 0.02 <= adv_interval <= 0.05:
+                return True
+
+        # Default to false - require explicit evidence
+        return False
+
+    def _collect_airtag_evidence(self) -> Dict[str, bool]:
+        """Gather the AirTag evidence carried by the advertisement content itself
+
+        Also records the decoded Apple fields (status, battery, Find My UUID) on the
+        device. Depends only on the payload and name, so it is rerun only when the
+        advertisement changes.
+        """
         # Store verification flags with confidence levels
         evidence = {
             "name_match": False,
@@ -902,77 +1424,64 @@ class Device:
             "service_data": False,
             "nearby_interaction": False,
             "status_bits": False,
-            "advertisement_interval": False,
-            "daily_advertisement_update": False,
             "unregistered_airtag": False,  # New flag for unregistered AirTags
             "battery_status": False,  # New flag for battery status detection
+            "known_tracker": False,  # Non-Apple tracker matched by company, UUID and name
         }
 
         # Check manufacturer first - must be Apple for AirTags
-        if 76 in self.manufacturer_data:  # Apple's company identifier (0x004C)
+        apple = self._apple_payload
+        if apple is not None:  # Apple's company identifier (0x004C)
             evidence["apple_manufacturer"] = True
 
             # Now check Apple-specific data patterns with high confidence
-            data = self.manufacturer_data[76]
+            data = apple.data
 
             # Only proceed with pattern matching if we have enough data
-            if len(data) > 2:
-                # Check all known Find My patterns
-                for pattern in FIND_MY_DATA_PATTERNS:
-                    offset = pattern["offset"]
-                    value = pattern["value"]
-                    mask = pattern["mask"]
-
-                    if offset < len(data) and (data[offset] & mask) == value:
-                        evidence["find_my_pattern"] = True
-
-                        # Also store the Apple advertisement type for further analysis
-                        if offset == 0:
-                            if data[0] in APPLE_ADV_TYPES:
-                                self.apple_adv_type = APPLE_ADV_TYPES[data[0]]
-                            else:
-                                self.apple_adv_type = (
-                                    f"Unknown Apple Type: {data[0]:02X}"
-                                )
-                        break
+            if apple.length > 2:
+                # Known Find My patterns, matched once when the payload was parsed
+                if apple.data_pattern_offset is not None:
+                    evidence["find_my_pattern"] = True
+
+                    # Also store the Apple advertisement type for further analysis
+                    if apple.data_pattern_offset == 0:
+                        if data[0] in APPLE_ADV_TYPES:
+                            self.apple_adv_type = APPLE_ADV_TYPES[data[0]]
+                        else:
+                            self.apple_adv_type = f"Unknown Apple Type: {data[0]:02X}"
 
                 # Exact Find My network pattern (highest confidence) - Registered AirTag
-                if len(data) > 1 and data[0] == 0x12 and data[1] == 0x19:
+                if apple.find_my:
                     evidence["find_my_pattern"] = True
 
                     # Exact AirTag identifier pattern - AirTag type is 0x0A
                     # According to Adam Catley's research, this is a definitive AirTag marker
-                    if len(data) > 3 and data[2] & 0x0F == 0x0A:
+                    if apple.length > 3 and apple.airtag_pattern:
                         evidence["airtag_pattern"] = True
 
                     # Check for AirTag status bits if we have enough data
                     # Adam's research shows status byte at position 5
-                    if len(data) >= 6:
-                        status_byte = data[5]
-                        # Store the AirTag status bits for display and analysis
+                    if apple.status_byte is not None:
+                        # Store the AirTag status bits for display and analysis,
+                        # visiting only the known bits that are actually set
+                        known_bits = apple.status_byte & AIRTAG_STATUS_MASK
                         self.airtag_status = {}
-                        for bit, meaning in AIRTAG_STATUS_BITS.items():
-                            if status_byte & bit:
-                                self.airtag_status[bit] = meaning
-                                evidence["status_bits"] = True
+                        if known_bits:
+                            evidence["status_bits"] = True
+                        while known_bits:
+                            bit = known_bits & -known_bits  # Lowest set bit
+                            self.airtag_status[bit] = AIRTAG_STATUS_BITS[bit]
+                            known_bits ^= bit
 
                     # Check for battery status in status byte at position 6
-                    if len(data) >= 7:
-                        battery_byte = data[6] & 0xF0
-                        if battery_byte in [0x10, 0x50, 0x90, 0xD0]:
-                            evidence["battery_status"] = True
-                            if battery_byte == 0x10:
-                                self.battery_status = "Battery Full"
-                            elif battery_byte == 0x50:
-                                self.battery_status = "Battery Medium"
-                            elif battery_byte == 0x90:
-                                self.battery_status = "Battery Low"
-                            elif battery_byte == 0xD0:
-                                self.battery_status = "Battery Very Low"
+                    battery_status = AIRTAG_BATTERY_STATUS.get(apple.battery_bits)
+                    if battery_status is not None:
+                        evidence["battery_status"] = True
+                        self.battery_status = battery_status
 
                 # Check for Unregistered AirTag pattern (type 0x07)
                 # According to new research, unregistered AirTags use this pattern
-                if len(data) > 1 and data[0] == 0x07 and data[1] == 0x19:
+                if apple.unregistered:
                     evidence["unregistered_airtag"] = True
                     # Store the information for later use
                     self.unregistered_airtag = True
@@ -980,97 +1489,28 @@ class Device:
                     # as it specifically identifies an unregistered AirTag
 
                 # Check for Nearby Interaction protocol (also used by Find My)
-                if len(data) > 2 and data[0] == 0x0F:
+                if apple.adv_type == 0x0F:
                     evidence["nearby_interaction"] = True
 
-        # Check for specific status update timing patterns
-        # According to Adam's research, AirTags update advertisement data every 15 minutes
-        # This is harder to detect in a single scan, but we can look for consistent advertisement
-        # interval around 2 seconds as mentioned in Adam's research
-        if hasattr(self, "last_seen") and getattr(self, "previous_seen", None):
-            adv_interval = self.last_seen - self.previous_seen
-            # Registered AirTags advertise approximately every 2 seconds when away from owner
-            if 1.5 <= adv_interval <= 2.5:
-                evidence["advertisement_interval"] = True
-            # Unregistered AirTags advertise much more frequently (~33ms)
-            elif 0.02 <= adv_interval <= 0.05:
-                evidence["unregistered_airtag"] = True
-
         # If name contains clear AirTag identifiers
-        if self.name and any(
-            identifier in self.name.lower() for identifier in AIRTAG_IDENTIFIERS
-        ):
+        if self.name and _AIRTAG_NAME_RE.search(self._name_lower):
             evidence["name_match"] = True
 
         # Check for Find My Network specific UUIDs (high confidence indicators)
-        for uuid in self.service_uuids:
-            uuid_upper = uuid.upper()
-            for find_my_id in FIND_MY_UUIDS:
-                if find_my_id in uuid_upper:
-                    evidence["known_uuid"] = True
-                    # Store the matching Find My UUID for further analysis
-                    self.find_my_uuid = uuid
-                    break
+        for uuid, uuid_upper in zip(self.service_uuids, self._uuids_upper):
+            if _FIND_MY_RE.search(uuid_upper):
+                evidence["known_uuid"] = True
+                # Store the matching Find My UUID for further analysis
+                self.find_my_uuid = uuid
 
         # Check for specific service data patterns related to Find My network
-        for service_uuid, data in self.service_data.items():
-            service_uuid_upper = service_uuid.upper()
-            if any(find_my_id in service_uuid_upper for find_my_id in FIND_MY_UUIDS):
+        for service_uuid_upper, data in self._service_data_upper:
+            if _FIND_MY_RE.search(service_uuid_upper):
                 evidence["service_data"] = True
                 # Store the service data for further analysis
                 self.find_my_service_data = data.hex() if data else ""
                 break
 
-        # Apply decision rules for classification based on Adam Catley's research:
-
-        # Definite AirTag (extremely high confidence)
-        if (
-            # AirTag specific pattern mentioned in Adam's research - highest confidence
-            (evidence["apple_manufacturer"] and evidence["airtag_pattern"])
-            # Unregistered AirTag pattern
-            or (evidence["apple_manufacturer"] and evidence["unregistered_airtag"])
-            # Find My pattern with status bits is very high confidence
-            or (
-                evidence["apple_manufacturer"]
-                and evidence["find_my_pattern"]
-                and evidence["status_bits"]
-            )
-            # AirTag based on multiple high confidence indicators
-            or (
-                evidence["apple_manufacturer"]
-                and evidence["find_my_pattern"]
-                and evidence["known_uuid"]
-            )
-            # AirTag with battery status indicators
-            or (
-                evidence["apple_manufacturer"]
-                and evidence["find_my_pattern"]
-                and evidence["battery_status"]
-            )
-            # AirTag with correct advertisement interval timings per Adam's research
-            or (
-                evidence["apple_manufacturer"]
-                and evidence["find_my_pattern"]
-                and evidence["advertisement_interval"]
-            )
-            # Old but reliable pattern according to Adam's research
-            or (
-                evidence["apple_manufacturer"]
-                and evidence["nearby_interaction"]
-                and evidence["known_uuid"]
-            )
-        ):
-            return True
-
-        # High confidence Find My device (not necessarily an AirTag)
-        if (
-            (evidence["apple_manufacturer"] and evidence["find_my_pattern"])
-            or (evidence["apple_manufacturer"] and evidence["known_uuid"])
-            or (evidence["apple_manufacturer"] and evidence["service_data"])
-            or (evidence["name_match"] and evidence["known_uuid"])
-        ):
-            return True
-
         # For non-Apple manufacturers, require stronger evidence for trackers
         if not evidence["apple_manufacturer"]:
             # Check for specific non-Apple tracking devices
@@ -1081,19 +1521,17 @@ class Device:
                 # Verify manufacturer ID matches
                 if tracker_info["company_id"] in self.manufacturer_data:
                     # For non-Apple devices, require exact UUID matches
-                    for uuid in self.service_uuids:
-                        uuid_upper = uuid.upper()
+                    for uuid_upper in self._uuids_upper:
                         for tracker_uuid in tracker_info["uuids"]:
                             if tracker_uuid in uuid_upper:
                                 # Verify with name match for higher confidence
                                 if self.name and any(
-                                    identifier in self.name.lower()
+                                    identifier in self._name_lower
                                     for identifier in tracker_info["identifiers"]
                                 ):
-                                    return True
+                                    evidence["known_tracker"] = True
 
-        # Default to false - require explicit evidence
-        return False
+        return evidence
 
     def _calculate_tracker_confidence(self) -> int:
         """Calculate confidence level for tracker detection (0 = confirmed, 4 = unlikely)
@@ -1101,111 +1539,90 @@ class Device:
         if not self.is_airtag:
             return TRACKING_CONFIDENCE["UNLIKELY"]
 
-        # Count evidence points
+        # Points from the advertisement content are scored once per payload
+        if self._confidence_points is None:
+            self._confidence_points = self._score_content_evidence()
+        evidence_points = self._confidence_points
+
+        # Check consistent advertisement timing if data available
+        if self.previous_seen:
+            adv_interval = self.last_seen - self.previous_seen
+            # According to Adam's research, AirTags advertise every ~2 seconds when separated
+            if 1.8 <= adv_interval <= 2.2:
+                evidence_points += 2
+
+        # Check AirTag power states if data is available
+        if len(self.rssi_history) >= 5:
+            # Look for patterns of consistent signal that match AirTag advertisement pattern
+            # AirTags advertise every 2 seconds with relatively stable power
+            avg_diff = self._rssi_abs_diff_sum / (len(self.rssi_history) - 1)
+            if (
+                avg_diff < 5
+            ):  # Stable RSSI indicates fixed location and consistent transmission
+                evidence_points += 1
+
+        # Determine confidence level based on evidence points (see CONFIDENCE_THRESHOLDS)
+        return _CONFIDENCE_BY_POINTS[
+            min(evidence_points, len(_CONFIDENCE_BY_POINTS) - 1)
+        ]
+
+    def _score_content_evidence(self) -> int:
+        """Count the tracker confidence points carried by the advertisement content"""
         evidence_points = 0
 
         # Check manufacturer - Apple devices get points
-        if 76 in self.manufacturer_data:
+        apple = self._apple_payload
+        if apple is not None:
             evidence_points += 1
 
             # Check for Find My pattern in manufacturer data
-            data = self.manufacturer_data[76]
-            if len(data) > 1:
+            if apple.length > 1:
                 # Classic Find My pattern from Adam Catley's research (0x12, 0x19)
-                if data[0] == 0x12 and data[1] == 0x19:
+                if apple.find_my:
                     evidence_points += 3
 
                 # AirTag specific pattern (type byte is 0x0A) - strongest evidence according to research
-                if len(data) > 2 and data[2] & 0x0F == 0x0A:
+                if apple.type_nibble == 0x0A:
                     evidence_points += (
                         5  # Increased due to high confidence based on research
                     )
 
                 # Check for status bits - strong evidence for AirTag
-                if len(data) >= 6:
-                    status_byte = data[5]
-                    # If any status bits are set that match known AirTag states
-                    if status_byte & 0x01:  # Separated from owner
-                        evidence_points += 4
-                    if status_byte & 0x02:  # Play Sound
-                        evidence_points += 4
-                    if status_byte & 0x04:  # Lost Mode
-                        evidence_points += 4
+                if apple.status_byte is not None:
+                    # Points for the known AirTag states (Separated, Play Sound, Lost Mode) set
+                    evidence_points += _STATUS_BYTE_POINTS[apple.status_byte]
 
                 # Other Apple Find My patterns identified in Adam's research
-                if data[0] == 0x10:  # Nearby Action/Find My
-                    evidence_points += 3
-                elif data[0] == 0x0F:  # Nearby Interaction
-                    evidence_points += 2
-                elif data[0] == 0x07 or data[0] == 0x01:  # AirPods patterns
-                    evidence_points += (
-                        1  # Lower points as these are not tracker-specific
-                    )
+                evidence_points += _APPLE_ADV_TYPE_POINTS.get(apple.adv_type, 0)
 
         # Check name for AirTag indicators
-        if self.name and any(
-            identifier in self.name.lower() for identifier in AIRTAG_IDENTIFIERS
-        ):
+        if self.name and _AIRTAG_NAME_RE.search(self._name_lower):
             evidence_points += 2
 
         # Check for Find My UUIDs
-        for uuid in self.service_uuids:
-            uuid_upper = uuid.upper()
-            for find_my_id in FIND_MY_UUIDS:
-                if find_my_id in uuid_upper:
-                    # Higher points for more specific Find My UUIDs identified by Adam
-                    if any(
-                        specific_id in uuid_upper
-                        for specific_id in ["7DFC9000", "7DFC9001"]
-                    ):
-                        evidence_points += (
-                            3  # Higher confidence for specific AirTag UUIDs
-                        )
-                    else:
-                        evidence_points += 2
-                    break
+        for uuid_upper in self._uuids_upper:
+            if _FIND_MY_RE.search(uuid_upper):
+                # Higher points for more specific Find My UUIDs identified by Adam
+                if _SPECIFIC_AIRTAG_RE.search(uuid_upper):
+                    evidence_points += 3  # Higher confidence for specific AirTag UUIDs
+                else:
+                    evidence_points += 2
 
         # Check for Find My service data
-        for service_uuid, _ in self.service_data.items():
-            service_uuid_upper = service_uuid.upper()
-            if any(find_my_id in service_uuid_upper for find_my_id in FIND_MY_UUIDS):
+        for service_uuid_upper, _ in self._service_data_upper:
+            if _FIND_MY_RE.search(service_uuid_upper):
                 evidence_points += 2
                 break
 
-        # Check consistent advertisement timing if data available
-        if hasattr(self, "last_seen") and getattr(self, "previous_seen", None):
-            adv_interval = self.last_seen - self.previous_seen
-            # According to Adam's research, AirTags advertise every ~2 seconds when separated
-            if 1.8 <= adv_interval <= 2.2:
-                evidence_points += 2
-
-        # Check AirTag power states if data is available
-        if hasattr(self, "rssi_history") and len(self.rssi_history) >= 5:
-            # Look for patterns of consistent signal that match AirTag advertisement pattern
-            # AirTags advertise every 2 seconds with relatively stable power
-            rssi_diffs = [
-                abs(self.rssi_history[i] - self.rssi_history[i - 1])
-                for i in range(1, len(self.rssi_history))
-            ]
-            avg_diff = sum(rssi_diffs) / len(rssi_diffs)
-            if (
-                avg_diff < 5
-            ):  # Stable RSSI indicates fixed location and consistent transmission
-                evidence_points += 1
-
-        # Determine confidence level based on evidence points - thresholds adjusted based on research
-        if evidence_points >= 9:  # Increased for definitive identification
-            return TRACKING_CONFIDENCE["CONFIRMED"]
-        elif evidence_points >= 6:  # Adjusted for high confidence
-            return TRACKING_CONFIDENCE["HIGH"]
-        elif evidence_points >= 4:  # Adjusted for medium confidence
-            return TRACKING_CONFIDENCE["MEDIUM"]
-        elif evidence_points >= 1:
-            return TRACKING_CONFIDENCE["LOW"]
-        else:
-            return TRACKING_CONFIDENCE["UNLIKELY"]
+        return evidence_points
 
     def get_tracker_type(self) -> str:
+        """Identify the specific type of tracking device, cached until the next advertisement"""
+        if self._tracker_type is None:
+            self._tracker_type = self._identify_tracker_type()
+        return self._tracker_type
+
+    def _identify_tracker_type(self) -> str:
         """Identify the specific type of tracking device based on Adam Catley's AirTag research"""
         if not self.is_airtag:
             return "Not a tracker"
@@ -1213,96 +1630,73 @@ class Device:
         # --- AirTag Identification (High Confidence) ---
         if self.manufacturer == "Apple":
             # Definitive AirTag signal with type byte 0x0A as documented by Adam Catley
-            if 76 in self.manufacturer_data and len(self.manufacturer_data[76]) > 2:
-                data = self.manufacturer_data[76]
-
+            apple = self._apple_payload
+            if apple is not None and apple.length > 2:
                 # Check for specific AirTag type byte (0x0A)
-                if len(data) > 3 and data[2] & 0x0F == 0x0A:
+                if apple.length > 3 and apple.type_nibble == 0x0A:
                     # Check if we've observed timing characteristics of AirTags
-                    if (
-                        hasattr(self, "consistent_airtag_interval")
-                        and self.consistent_airtag_interval
-                    ):
+                    if self.consistent_airtag_interval:
                         return "Apple AirTag (Verified)"
                     else:
                         return "Apple AirTag"
 
                 # Check for exact FindMy protocol with status bits that match AirTag
+                status_byte = apple.status_byte
                 if (
-                    len(data) > 5
-                    and data[0] == 0x12
-                    and data[1] == 0x19
-                    and data[5] & 0x07
+                    apple.find_my and status_byte is not None and status_byte & 0x07
                 ):  # Check if any status bits are set
 
                     # Check status byte for AirTag-specific bits identified by Adam
                     status_bits = []
-                    if data[5] & 0x01:
+                    if status_byte & 0x01:
                         status_bits.append("Separated")
-                    if data[5] & 0x02:
+                    if status_byte & 0x02:
                         status_bits.append("Play Sound")
-                    if data[5] & 0x04:
+                    if status_byte & 0x04:
                         status_bits.append("Lost Mode")
 
                     if status_bits:
                         return f"Apple AirTag ({', '.join(status_bits)})"
 
                 # Unregistered AirTag pattern - type 0x07, 0x19 as per new research
-                if data[0] == 0x07 and data[1] == 0x19:
+                if apple.unregistered:
                     return "Unregistered Apple AirTag"
 
                 # Find My pattern but no specific AirTag identifier - type 0x12, 0x19
-                if data[0] == 0x12 and data[1] == 0x19:
+                if apple.find_my:
                     # Check for battery status indicator to improve confidence
-                    if hasattr(self, "battery_status"):
+                    if self.battery_status is not None:
                         return f"Apple AirTag ({self.battery_status})"
 
                     # Check timing characteristics unique to AirTags according to Adam
-                    if (
-                        hasattr(self, "consistent_airtag_interval")
-                        and self.consistent_airtag_interval
-                    ):
+                    if self.consistent_airtag_interval:
                         return "Likely Apple AirTag"
-                    elif (
-                        hasattr(self, "matches_airtag_timing")
-                        and self.matches_airtag_timing
-                    ):
+                    elif self.matches_airtag_timing:
                         return "Likely Apple AirTag"
-                    elif (
-                        hasattr(self, "crypto_counter_matches")
-                        and self.crypto_counter_matches
-                    ):
+                    elif self.crypto_counter_matches:
                         return "Likely Apple AirTag (15min cycle)"
                     else:
                         return "Apple Find My Device"
 
                 # Nearby Interaction protocol (0x0F) with confident timing
-                if data[0] == 0x0F and hasattr(self, "consistent_airtag_interval"):
+                if apple.adv_type == 0x0F and self.consistent_airtag_interval:
                     return "Likely Apple AirTag"
 
             # Clear name match
-            if self.name and "airtag" in self.name.lower():
+            if self.name and "airtag" in self._name_lower:
                 return "Apple AirTag"
 
             # Check for Find My Network specific UUIDs identified by Adam Catley
-            for uuid in self.service_uuids:
-                uuid_upper = uuid.upper()
+            for uuid_upper in self._uuids_upper:
                 # More specific UUIDs that are strongly associated with AirTags
-                if any(
-                    find_my_id in uuid_upper for find_my_id in ["7DFC9000", "7DFC9001"]
-                ):
+                if _SPECIFIC_AIRTAG_RE.search(uuid_upper):
                     return "Apple AirTag"
                 # General Find My network UUIDs
-                elif any(
-                    find_my_id in uuid_upper for find_my_id in ["0000FD44", "74278BDA"]
-                ):
+                elif _FIND_MY_NETWORK_RE.search(uuid_upper):
                     return "Apple Find My Device"
 
             # Check for advertisement interval pattern (2s) specific to AirTags (Adam's research)
-            if (
-                hasattr(self, "adv_interval_history")
-                and len(self.adv_interval_history) >= 5
-            ):
+            if len(self.adv_interval_history) >= 5:
                 avg_interval = sum(self.adv_interval_history) / len(
                     self.adv_interval_history
                 )
@@ -1310,7 +1704,7 @@ class Device:
                     return "Likely Apple AirTag"
 
             # Check for 15-minute advertisement data update pattern described by Adam
-            if hasattr(self, "matches_airtag_timing") and self.matches_airtag_timing:
+            if self.matches_airtag_timing:
                 return "Likely Apple AirTag"
 
             # Other Apple device that uses Find My network
@@ -1319,29 +1713,27 @@ class Device:
         # --- Samsung SmartTag Identification ---
         if self.manufacturer == "Samsung":
             if (
-                "smarttag" in self.name.lower()
-                or "smart tag" in self.name.lower()
-                or "galaxy tag" in self.name.lower()
+                "smarttag" in self._name_lower
+                or "smart tag" in self._name_lower
+                or "galaxy tag" in self._name_lower
             ):
                 return "Samsung SmartTag"
 
             # Check for Samsung SmartTag service UUID
-            for uuid in self.service_uuids:
-                if "FD5A" in uuid.upper():
+            for uuid_upper in self._uuids_upper:
+                if "FD5A" in uuid_upper:
                     return "Samsung SmartTag"
 
         # --- Tile Identification ---
         if self.manufacturer == "Tile" or any(
-            "tile" == word for word in self.name.lower().split()
+            "tile" == word for word in self._name_lower.split()
         ):
             return "Tile Tracker"
 
         # --- Chipolo Identification ---
-        if "chipolo" in self.name.lower():
-            for uuid in self.service_uuids:
-                if any(
-                    chipolo_uuid in uuid.upper() for chipolo_uuid in ["FEE1", "FEE0"]
-                ):
+        if "chipolo" in self._name_lower:
+            for uuid_upper in self._uuids_upper:
+                if any(chipolo_uuid in uuid_upper for chipolo_uuid in ["FEE1", "FEE0"]):
                     return "Chipolo Tracker"
 
         # Generic tracker if we can't identify the specific type but it triggered our tracker detection
@@ -1349,44 +1741,23 @@ class Device:
 
     @property
     def smooth_rssi(self) -> float:
-        """Get smoothed RSSI value using Kalman-inspired filtering for better stability"""
-        if not self.rssi_history:
-            return self.rssi
-
-        # Use more sophisticated smoothing algorithm for better stability
-        # This is a simplified Kalman-inspired approach for RSSI
-
-        # First remove outliers (more than 15 dBm from median)
-        if len(self.rssi_history) >= 5:
-            median_rssi = sorted(self.rssi_history)[len(self.rssi_history) // 2]
-            filtered_values = [
-                r for r in self.rssi_history if abs(r - median_rssi) <= 15
-            ]
-            if filtered_values:  # Ensure we still have values after filtering
-                rssi_values = filtered_values
-            else:
-                rssi_values = list(self.rssi_history)
-        else:
-            rssi_values = list(self.rssi_history)
-
-        # Calculate weighted average (more recent values have higher weight)
-        if len(rssi_values) <= 2:
-            # Simple average for small number of readings
-            return sum(rssi_values) / len(rssi_values)
-
-        # Weighted average based on recency
-        total_weight = 0
-        weighted_sum = 0
-        for i, rssi in enumerate(rssi_values):
-            # Exponential weighting - more recent values get higher weight
-            weight = math.exp(0.5 * i / len(rssi_values))
-            weighted_sum += rssi * weight
-            total_weight += weight
-
-        return weighted_sum / total_weight if total_weight else self.rssi
+        """Get smoothed RSSI value from the incremental Kalman filter estimate"""
+        return self._kf_x
 
     @property
     def distance(self) -> float:
+        """Approximate distance, computed once per RSSI reading and calibration"""
+        key = (
+            self.calibrated_n_value,
+            self.calibrated_rssi_at_one_meter,
+            self.device_type,
+        )
+        if self._distance is None or self._distance_key != key:
+            self._distance = self._estimate_distance()
+            self._distance_key = key
+        return self._distance
+
+    def _estimate_distance(self) -> float:
         """Calculate approximate distance with improved environment correction for long range"""
         if self.smooth_rssi == 0:
             return float("inf")
@@ -1396,18 +1767,7 @@ class Device:
 
         # Apply signal strength correction based on device type and environment
         # Different device types and environments affect signal differently
-        rssi_correction = 0
-
-        # Adjust for known device types
-        if self.device_type.lower() in ["airtag", "apple airtag"]:
-            # AirTags tend to have stronger signals
-            rssi_correction = -2  # Subtract 2 dBm (signal appears stronger than it is)
-        elif "tag" in self.device_type.lower() or "tracker" in self.device_type.lower():
-            # Other trackers may need different adjustments
-            rssi_correction = -1
-        elif "find my" in self.device_type.lower():
-            # Find My devices may need a specific correction
-            rssi_correction = -3
+        rssi_correction = _device_type_rssi_correction(self.device_type)
 
         # Adjust environment factor based on signal stability
         stability = self.signal_stability
@@ -1465,14 +1825,18 @@ class Device:
     def calibrate_distance(self, known_distance: float):
         """Calibrate distance calculation for this device at a known distance"""
         if self.smooth_rssi != 0 and known_distance > 0:
-            # Calculate N factor based on known distance
-            self.calibrated_n_value = abs(
-                (self.calibrated_rssi_at_one_meter - self.smooth_rssi)
-                / (10 * math.log10(known_distance))
-            )
+            log_distance = math.log10(known_distance)  # Shared by both formulas below
+
+            # Calculate N factor based on known distance (the path loss is zero at
+            # exactly 1m, so there the N factor cannot be derived and is kept)
+            if log_distance != 0:
+                self.calibrated_n_value = abs(
+                    (self.calibrated_rssi_at_one_meter - self.smooth_rssi)
+                    / (10 * log_distance)
+                )
 
-            # Validate and limit to reasonable ranges (1.0 to 4.0)
-            self.calibrated_n_value = max(1.0, min(4.0, self.calibrated_n_value))
+                # Validate and limit to reasonable ranges (1.0 to 4.0)
+                self.calibrated_n_value = max(1.0, min(4.0, self.calibrated_n_value))
 
             # Also update the RSSI at one meter based on the measurement
             # This is especially useful for the first calibration point
@@ -1481,7 +1845,7 @@ class Device:
             elif known_distance < 1.0:
                 # If we have a closer measurement, extrapolate to 1m
                 self.calibrated_rssi_at_one_meter = self.smooth_rssi - (
-                    10 * self.calibrated_n_value * math.log10(known_distance)
+                    10 * self.calibrated_n_value * log_distance
                 )
 
             return True
@@ -1494,23 +1858,27 @@ class Device:
 
     @property
     def signal_stability(self) -> float:
+        """Signal stability noise metric, computed once per RSSI reading"""
+        if self._signal_stability is None:
+            self._signal_stability = self._measure_signal_stability()
+        return self._signal_stability
+
+    def _measure_signal_stability(self) -> float:
         """Calculate signal stability as improved noise metric"""
         if len(self.rssi_history) < 3:
             return 0.0
 
-        # Calculate standard deviation of RSSI values
-        mean = sum(self.rssi_history) / len(self.rssi_history)
-        variance = sum((x - mean) ** 2 for x in self.rssi_history) / len(
-            self.rssi_history
+        # Calculate standard deviation of RSSI values from the running integer sums,
+        # exact until the single division: n * sum(x^2) - sum(x)^2 over n^2
+        count = len(self.rssi_history)
+        variance = (count * self._rssi_sq_sum - self._rssi_sum * self._rssi_sum) / (
+            count * count
         )
         std_dev = math.sqrt(variance)
 
-        # Calculate rate of change (first derivative)
-        rssi_list = list(self.rssi_history)
-        deltas = [
-            abs(rssi_list[i] - rssi_list[i - 1]) for i in range(1, len(rssi_list))
-        ]
-        avg_delta = sum(deltas) / len(deltas) if deltas else 0
+        # Calculate rate of change (first derivative) from the running sum of
+        # consecutive differences kept by update()
+        avg_delta = self._rssi_abs_diff_sum / (count - 1)
 
         # Combined stability metric (weighted sum of std dev and rate of change)
         # Lower values indicate more stable signal
@@ -1520,18 +1888,19 @@ class Device:
 
     @property
     def signal_quality(self) -> float:
+        """Signal quality on a scale of 0-100%, computed once per RSSI reading"""
+        duration = self.seen_duration
+        if self._signal_quality is None or self._signal_quality_duration != duration:
+            self._signal_quality = self._assess_signal_quality(duration)
+            self._signal_quality_duration = duration
+        return self._signal_quality
+
+    def _assess_signal_quality(self, duration: float) -> float:
         """Assess signal quality on a scale of 0-100%"""
         # Start with base quality from RSSI
-        if self.smooth_rssi >= -50:
-            base_quality = 100  # Excellent signal
-        elif self.smooth_rssi >= -65:
-            base_quality = 80  # Very good signal
-        elif self.smooth_rssi >= -75:
-            base_quality = 60  # Good signal
-        elif self.smooth_rssi >= -85:
-            base_quality = 40  # Fair signal
-        else:
-            base_quality = 20  # Poor signal
+        base_quality = _QUALITY_BY_RSSI_BIN[
+            bisect_right(_QUALITY_RSSI_BINS, self.smooth_rssi)
+        ]
 
         # Reduce quality based on signal stability
         stability = self.signal_stability
@@ -1541,7 +1910,6 @@ class Device:
 
         # Reduce quality based on duration (better assessment over time)
         # More time means more confident assessment
-        duration = self.seen_duration
         duration_factor = min(
             1.0, duration / 30
         )  # Up to 30 seconds to reach max confidence
@@ -1556,29 +1924,30 @@ class Device:
         """Calculate how long this device has been observed"""
         return self.last_seen - self.first_seen
 
-    def update_proximity_trend(self) -> Tuple[str, float]:
+    def update_proximity_trend(self, now: Optional[float] = None) -> Tuple[str, float]:
         """Update and return the proximity trend (getting closer or further)
 
+        Args:
+            now: Timestamp of the reading, defaults to the current time
+
         Returns:
             Tuple containing the trend direction as a string and the rate of change
         """
         current_distance = self.distance
-        current_time = time.time()
+        current_time = time.time() if now is None else now
         trend_direction = "stable"
         change_rate = 0.0
 
         # Initialize previous distance and trend history if not set
-        if not hasattr(self, "previous_distance") or self.previous_distance is None:
+        if self.previous_distance is None:
             self.previous_distance = current_distance
             self.last_trend_update = current_time
-            if not hasattr(self, "distance_trend"):
-                self.distance_trend = []
             return trend_direction, change_rate
 
         # Only update if enough time has passed (100ms minimum)
         if current_time - self.last_trend_update < 0.1:
             # Return the last trend if available
-            if hasattr(self, "distance_trend") and self.distance_trend:
+            if self.distance_trend:
                 _, _, last_trend, last_rate = self.distance_trend[-1]
                 return last_trend, last_rate
             return trend_direction, change_rate
@@ -1593,7 +1962,7 @@ class Device:
         change_rate = distance_diff / time_diff
 
         # Apply smoothing to reduce fluctuations (exponential moving average)
-        if hasattr(self, "distance_trend") and self.distance_trend:
+        if self.distance_trend:
             _, _, _, last_rate = self.distance_trend[-1]
             # Blend new and old rates (70% new, 30% old)
             change_rate = (0.7 * change_rate) + (0.3 * last_rate)
@@ -1606,16 +1975,10 @@ class Device:
         else:
             trend_direction = "further"  # Getting further (positive rate)
 
-        # Initialize distance_trend if not already done
-        if not hasattr(self, "distance_trend"):
-            self.distance_trend = []
-
-        # Add to trend history (keep last 10 updates for better analysis)
+        # Add to trend history, the bounded deque drops the oldest update
         self.distance_trend.append(
             (current_time, current_distance, trend_direction, change_rate)
         )
-        if len(self.distance_trend) > 10:
-            self.distance_trend.pop(0)
 
         # Update previous values for next calculation
         self.previous_distance = current_distance
@@ -1625,16 +1988,14 @@ class Device:
 
     def get_trend_summary(self) -> str:
         """Get a human-readable summary of the proximity trend"""
-        if not hasattr(self, "distance_trend") or not self.distance_trend:
+        if not self.distance_trend:
             return "Monitoring proximity trend..."
 
         # Get the latest trend
         _, _, latest_trend, latest_rate = self.distance_trend[-1]
 
         # Count trends in history to determine consistency
-        trend_counts = {"closer": 0, "further": 0, "stable": 0}
-        for _, _, trend, _ in self.distance_trend:
-            trend_counts[trend] += 1
+        trend_counts = self._count_trends()
 
         # Determine most common trend
         max_trend = max(trend_counts.items(), key=lambda x: x[1])
@@ -1642,16 +2003,7 @@ class Device:
 
         # Format the rate of change
         rate_abs = abs(latest_rate)
-        if rate_abs < 0.01:
-            rate_text = "very slowly"
-        elif rate_abs < 0.05:
-            rate_text = "slowly"
-        elif rate_abs < 0.2:
-            rate_text = "steadily"
-        elif rate_abs < 0.5:
-            rate_text = "quickly"
-        else:
-            rate_text = "very quickly"
+        rate_text = _RATE_LABELS[bisect_right(_RATE_BINS, rate_abs)]
 
         # Create the message
         if latest_trend == "stable":
@@ -1663,13 +2015,41 @@ class Device:
             confidence = "Consistently" if consistent else "Possibly"
             return f"{confidence} moving away {rate_text} ({rate_abs:.2f}m/s)"
 
+    def _count_trends(self) -> Dict[str, int]:
+        """Count each trend direction in the history in a single pass"""
+        trend_counts = {"closer": 0, "further": 0, "stable": 0}
+        for _, _, trend, _ in self.distance_trend:
+            trend_counts[trend] += 1
+        return trend_counts
+
+    def _proximity_stats(self) -> Tuple[float, float, str, float]:
+        """Current distance, average recent rate, dominant direction and its confidence
+
+        Requires at least 2 entries in distance_trend.
+        """
+        # Current reading
+        current_distance = self.distance_trend[-1][1]
+
+        # Calculate average rate from last 3 readings if available
+        recent_trend = list(
+            islice(self.distance_trend, max(0, len(self.distance_trend) - 3), None)
+        )
+        avg_rate = sum(rate for _, _, _, rate in recent_trend) / len(recent_trend)
+
+        # Count direction occurrences for confidence calculation
+        direction_counts = self._count_trends()
+
+        # Determine dominant direction
+        dominant_direction = max(direction_counts, key=direction_counts.get)
+
+        # Calculate confidence level (0.0 to 1.0)
+        confidence = direction_counts[dominant_direction] / len(self.distance_trend)
+
+        return current_distance, avg_rate, dominant_direction, confidence
+
     def get_detailed_proximity_analysis(self) -> Dict:
         """Get detailed proximity analysis with prediction"""
-        if (
-            not hasattr(self, "distance_trend")
-            or not self.distance_trend
-            or len(self.distance_trend) < 2
-        ):
+        if len(self.distance_trend) < 2:
             return {
                 "status": "initializing",
                 "message": "Initializing trend analysis...",
@@ -1677,36 +2057,13 @@ class Device:
                 "rate": 0.0,
                 "prediction": None,
                 "confidence": 0.0,
-                "data_points": (
-                    len(self.distance_trend)
-                    if hasattr(self, "distance_trend") and self.distance_trend
-                    else 0
-                ),
+                "data_points": len(self.distance_trend),
             }
 
-        # Current and previous readings
-        current_time, current_distance, current_trend, current_rate = (
-            self.distance_trend[-1]
+        current_distance, avg_rate, dominant_direction, confidence = (
+            self._proximity_stats()
         )
 
-        # Calculate average rate from last 3 readings if available
-        rates = [rate for _, _, _, rate in self.distance_trend[-3:]]
-        avg_rate = sum(rates) / len(rates)
-
-        # Count direction occurrences for confidence calculation
-        directions = [trend for _, _, trend, _ in self.distance_trend]
-        direction_counts = {
-            "closer": directions.count("closer"),
-            "further": directions.count("further"),
-            "stable": directions.count("stable"),
-        }
-
-        # Determine dominant direction
-        dominant_direction = max(direction_counts, key=direction_counts.get)
-
-        # Calculate confidence level (0.0 to 1.0)
-        confidence = direction_counts[dominant_direction] / len(directions)
-
         # Make short-term prediction (where will distance be in 5 seconds)
         prediction_time = 5.0  # seconds
         predicted_distance = current_distance + (avg_rate * prediction_time)
@@ -1763,16 +2120,12 @@ class Device:
 
     def get_movement_guidance(self) -> str:
         """Generate guidance to help user locate the device"""
-        # Get the detailed analysis first
-        analysis = self.get_detailed_proximity_analysis()
-
-        if analysis["status"] == "initializing":
+        # Needs the same trend statistics as the detailed analysis, but none of
+        # its prediction and message formatting
+        if len(self.distance_trend) < 2:
             return "Move slowly in any direction to establish a baseline..."
 
-        current_distance = analysis.get("current_distance", self.distance)
-        direction = analysis.get("direction", "unknown")
-        rate = analysis.get("rate", 0.0)
-        confidence = analysis.get("confidence", 0.0)
+        current_distance, rate, direction, confidence = self._proximity_stats()
 
         # Very close to device
         if current_distance < 0.5:
@@ -1811,11 +2164,26 @@ class Device:
             else:
                 return "You're moving parallel to the device. Try changing direction."
 
+    def snapshot(self) -> "Device":
+        """Return a copy that later update() calls on this device won't change
+
+        Payload bytes are immutable and shared; only the containers that update()
+        mutates in place are copied.
+        """
+        clone = copy.copy(self)
+        clone.rssi_history = array.array("b", self.rssi_history)
+        clone.distance_trend = self.distance_trend.copy()
+        clone.adv_interval_history = self.adv_interval_history.copy()
+        clone.airtag_status = dict(self.airtag_status)
+        if self.prev_manufacturer_data is not None:
+            clone.prev_manufacturer_data = dict(self.prev_manufacturer_data)
+        return clone
+
     def to_dict(self) -> Dict:
         """Convert device to dictionary for storage including AirTag detection properties"""
         # Convert distance_trend to a serializable format
         serializable_trend = []
-        for timestamp, distance, trend, rate in getattr(self, "distance_trend", []):
+        for timestamp, distance, trend, rate in self.distance_trend:
             serializable_trend.append(
                 {
                     "timestamp": timestamp,
@@ -1826,7 +2194,7 @@ class Device:
             )
 
         # Convert advertisement interval history to serializable format
-        adv_interval_history = list(getattr(self, "adv_interval_history", []))
+        adv_interval_history = list(self.adv_interval_history)
 
         # Basic device data
         result = {
@@ -1842,7 +2210,7 @@ class Device:
             "last_seen": self.last_seen,
             "is_airtag": self.is_airtag,
             "tracker_confidence": self.tracker_confidence,
-            "is_new": getattr(self, "is_new", False),
+            "is_new": self.is_new,
             "distance": self.distance,
             "calibrated_n_value": self.calibrated_n_value,
             "calibrated_rssi_at_one_meter": self.calibrated_rssi_at_one_meter,
@@ -1850,39 +2218,37 @@ class Device:
             "device_type": self.device_type,
             "device_details": self.device_details,
             # Include proximity tracking data
-            "previous_distance": getattr(self, "previous_distance", None),
+            "previous_distance": self.previous_distance,
             "distance_trend": serializable_trend,
-            "last_trend_update": getattr(self, "last_trend_update", 0),
+            "last_trend_update": self.last_trend_update,
             # Include AirTag detection properties based on Adam Catley's research
-            "previous_seen": getattr(self, "previous_seen", None),
-            "adv_interval": getattr(self, "adv_interval", None),
+            "previous_seen": self.previous_seen,
+            "adv_interval": self.adv_interval,
             "adv_interval_history": adv_interval_history,
-            "consistent_airtag_interval": getattr(
-                self, "consistent_airtag_interval", False
-            ),
-            "adv_changes": getattr(self, "adv_changes", 0),
-            "last_adv_change_time": getattr(self, "last_adv_change_time", None),
-            "prev_adv_change_time": getattr(self, "prev_adv_change_time", None),
-            "adv_change_interval": getattr(self, "adv_change_interval", None),
-            "matches_airtag_timing": getattr(self, "matches_airtag_timing", False),
-            "apple_adv_type": getattr(self, "apple_adv_type", None),
-            "find_my_uuid": getattr(self, "find_my_uuid", None),
-            "find_my_service_data": getattr(self, "find_my_service_data", None),
-            "airtag_status": getattr(self, "airtag_status", {}),
+            "consistent_airtag_interval": self.consistent_airtag_interval,
+            "adv_changes": self.adv_changes,
+            "last_adv_change_time": self.last_adv_change_time,
+            "prev_adv_change_time": self.prev_adv_change_time,
+            "adv_change_interval": self.adv_change_interval,
+            "matches_airtag_timing": self.matches_airtag_timing,
+            "apple_adv_type": self.apple_adv_type,
+            "find_my_uuid": self.find_my_uuid,
+            "find_my_service_data": self.find_my_service_data,
+            "airtag_status": self.airtag_status,
             # New AirTag detection properties
-            "unregistered_airtag": getattr(self, "unregistered_airtag", False),
-            "battery_status": getattr(self, "battery_status", None),
-            "crypto_counter": getattr(self, "crypto_counter", None),
-            "crypto_counter_time": getattr(self, "crypto_counter_time", None),
-            "crypto_counter_matches": getattr(self, "crypto_counter_matches", False),
+            "unregistered_airtag": self.unregistered_airtag,
+            "battery_status": self.battery_status,
+            "crypto_counter": self.crypto_counter,
+            "crypto_counter_time": self.crypto_counter_time,
+            "crypto_counter_matches": self.crypto_counter_matches,
         }
 
         # If we have stored the last advertisement data, convert it to a serializable format
-        if hasattr(self, "last_advertisement_data"):
+        if self.last_advertisement_data is not None:
             result["last_advertisement_data"] = list(self.last_advertisement_data)
 
         # Convert previous manufacturer data to serializable format if available
-        if hasattr(self, "prev_manufacturer_data"):
+        if self.prev_manufacturer_data is not None:
             result["prev_manufacturer_data"] = {
                 str(k): list(v) for k, v in self.prev_manufacturer_data.items()
             }
@@ -1921,7 +2287,7 @@ class Device:
 
         # Restore distance trend history
         if "distance_trend" in data and isinstance(data["distance_trend"], list):
-            device.distance_trend = []
+            device.distance_trend.clear()
             for trend_data in data["distance_trend"]:
                 if isinstance(trend_data, dict):
                     try:
@@ -1948,6 +2314,7 @@ class Device:
             data["adv_interval_history"], list
         ):
             device.adv_interval_history = deque(data["adv_interval_history"], maxlen=10)
+            device._adv_interval_sum = sum(device.adv_interval_history)
 
         if "consistent_airtag_interval" in data:
             device.consistent_airtag_interval = data["consistent_airtag_interval"]
@@ -2010,6 +2377,9 @@ class Device:
                 for k, v in data.get("prev_manufacturer_data", {}).items()
             }
 
+        # Restored timing flags may change the tracker type identified at creation
+        device._tracker_type = None
+
         return device
 
 
@@ -2019,6 +2389,19 @@ class TagFinder:
         self.devices: Dict[str, Device] = {}
         self.settings = self._load_settings()
         self.history: List[Dict] = self._load_history()
+        # Lines in the history file, used to decide when to compact it
+        self._history_lines = len(self.history)
+        # Set when a failed save may have left the file behind the index
+        self._history_rewrite_pending = False
+        # Appending saves since the file was last rewritten from the index
+        self._history_saves_since_compaction = 0
+        # Deduplicated history keyed by address and last_seen, plus the keys
+        # whose is_new flag may still need to expire
+        self._history_index: Dict[str, Dict] = {}
+        self._history_new_keys = set()
+        for entry in self.history:
+            self._index_history_entry(entry)
+        self.history = list(self._history_index.values())
         self.current_adapter = None
         self.scanning = False
         self.airtag_only_mode = self.settings.get("airtag_only_mode", False)
@@ -2059,6 +2442,17 @@ class TagFinder:
         self.next_device_id = 0  # Next ID to assign to a new device
         self.device_ids = {}  # Maps device address to its assigned ID
 
+        # Last device table and the fingerprint of everything it shows
+        self._device_table_cache: Optional[Tuple[Tuple, Table]] = None
+
+        # Devices rebuilt from summary dictionaries, keyed by address and last_seen
+        self._device_cache: Dict[Tuple[str, float], Device] = {}
+
+        # Live display rebuilds: set on advertisements and key presses, with the
+        # monotonic time of the last rebuild
+        self._ui_dirty = True
+        self._last_ui_update = 0.0
+
     def _create_layout(self) -> Layout:
         """Create the layout for the UI"""
         layout = Layout()
@@ -2077,9 +2471,9 @@ class TagFinder:
         """Load settings from JSON file"""
         if os.path.exists(SETTINGS_FILE):
             try:
-                with open(SETTINGS_FILE, "r") as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
+                with open(SETTINGS_FILE, "rb") as f:
+                    return _load_json(f.read())
+            except json.JSONDecodeError:  # Also raised by orjson
                 pass
         return {}
 
@@ -2087,8 +2481,8 @@ class TagFinder:
         """Save settings to JSON file"""
         # Save column visibility settings
         self.settings["visible_columns"] = self.visible_columns
-        with open(SETTINGS_FILE, "w") as f:
-            json.dump(self.settings, f, indent=2)
+        with open(SETTINGS_FILE, "wb") as f:
+            f.write(_dump_json(self.settings))
 
     def _update_sort_priority(self, sort_key: str, position: int = 0):
         """Update the sort priority by moving a key to the specified position
@@ -2116,11 +2510,31 @@ class TagFinder:
         self._save_settings()
 
     def _load_history(self) -> List:
-        """Load device history from JSON file"""
+        """Load device history from the JSON lines file"""
         if os.path.exists(HISTORY_FILE):
+            entries = []
+            try:
+                with open(HISTORY_FILE, "rb") as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        try:
+                            entry = _load_json(line)
+                        except json.JSONDecodeError:
+                            # Skip lines cut short by an interrupted save
+                            continue
+                        if isinstance(entry, dict):
+                            entries.append(entry)
+            except Exception:
+                # Handle any errors by returning an empty list
+                return []
+            return entries
+
+        # Fall back to the old single-array history file
+        if os.path.exists(LEGACY_HISTORY_FILE):
             try:
-                with open(HISTORY_FILE, "r") as f:
-                    data = json.load(f)
+                with open(LEGACY_HISTORY_FILE, "rb") as f:
+                    data = _load_json(f.read())
                     # Ensure we return a list even if the file contains a dict
                     if isinstance(data, dict):
                         return [data]
@@ -2133,56 +2547,85 @@ class TagFinder:
                 return []
         return []
 
-    async def _save_history(self):
-        """Save device history to JSON file"""
+    def _index_history_entry(self, entry: Dict) -> bool:
+        """Add a history entry to the deduplication index, returning True if it was new"""
         try:
-            # Convert current devices to dict and add to history
-            current_devices_data = []
-            for device in self.devices.values():
-                current_devices_data.append(device.to_dict())
+            key = f"{entry['address']}_{entry['last_seen']}"
+        except (KeyError, TypeError):
+            # Skip malformed entries
+            return False
 
-            # Ensure history is a list
-            if not isinstance(self.history, list):
-                self.history = []
+        if key in self._history_index:
+            return False
 
-            # Add to history
-            self.history.extend(current_devices_data)
+        self._history_index[key] = entry
+        if entry.get("is_new", False) and "first_seen" in entry:
+            self._history_new_keys.add(key)
+        return True
 
-            # Save to file - ensure we're not duplicating entries
-            unique_entries = {}
-            for entry in self.history:
-                try:
-                    address = entry["address"]
-                    timestamp = entry["last_seen"]
-                    key = f"{address}_{timestamp}"
-
-                    # Update is_new flag to respect the NEW_DEVICE_TIMEOUT
-                    # This ensures devices in history don't perpetually show as NEW
-                    if entry.get("is_new", False) and "first_seen" in entry:
-                        # If the device has been known for longer than the timeout, reset the flag
-                        if time.time() - entry["first_seen"] > NEW_DEVICE_TIMEOUT:
-                            entry["is_new"] = False
-
-                    unique_entries[key] = entry
-                except (KeyError, TypeError):
-                    # Skip malformed entries
-                    continue
+    async def _save_history(self):
+        """Save device history to JSON file"""
+        try:
+            # Merge only the current devices into the deduplication index
+            saved_count = 0
+            new_entries = []
+            for device in self.devices.values():
+                entry = device.to_dict()
+                if self._index_history_entry(entry):
+                    new_entries.append(entry)
+                saved_count += 1
+
+            # Update is_new flag to respect the NEW_DEVICE_TIMEOUT
+            # This ensures devices in history don't perpetually show as NEW.
+            # Only entries still flagged as new need checking.
+            cutoff = time.time() - NEW_DEVICE_TIMEOUT
+            history_index = self._history_index
+            expired_keys = [
+                key
+                for key in self._history_new_keys
+                if history_index[key]["first_seen"] < cutoff
+            ]
+            for key in expired_keys:
+                history_index[key]["is_new"] = False
+            self._history_new_keys.difference_update(expired_keys)
+            if expired_keys:
+                # Those entries are already in the file with is_new set
+                self._history_rewrite_pending = True
 
-            # Save only unique entries
-            with open(HISTORY_FILE, "w") as f:
-                json.dump(list(unique_entries.values()), f, indent=2)
+            self.history.extend(new_entries)
 
-            self.console.print(
-                f"[green]Saved {len(current_devices_data)} devices to history[/]"
-            )
+            self._history_saves_since_compaction += 1
+            if (
+                self._history_rewrite_pending
+                or self._history_saves_since_compaction >= HISTORY_COMPACTION_INTERVAL
+                or not os.path.exists(HISTORY_FILE)
+                or self._history_lines > 2 * len(self.history)
+            ):
+                self._compact_history()
+            elif new_entries:
+                # Append only the entries not already in the file
+                with open(HISTORY_FILE, "ab") as f:
+                    f.write(b"".join(map(_dump_json_line, new_entries)))
+                self._history_lines += len(new_entries)
+
+            self.console.print(f"[green]Saved {saved_count} devices to history[/]")
         except Exception as e:
             self.console.print(f"[bold red]Error saving history: {e}[/]")
-            # Try to create a new file if something went wrong
-            try:
-                with open(HISTORY_FILE, "w") as f:
-                    json.dump([], f)
-            except:
-                pass
+            # Keep the existing file, but rewrite it from the index next time
+            # in case entries were only partly written
+            self._history_rewrite_pending = True
+
+    def _compact_history(self):
+        """Rewrite the history file with one line per unique entry"""
+        # Write a temporary file and rename it over the old one so a failed
+        # write never leaves a truncated history behind
+        tmp_file = HISTORY_FILE + ".tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(b"".join(map(_dump_json_line, self.history)))
+        os.replace(tmp_file, HISTORY_FILE)
+        self._history_lines = len(self.history)
+        self._history_rewrite_pending = False
+        self._history_saves_since_compaction = 0
 
     async def list_adapters(self):
         """List all available Bluetooth adapters"""
@@ -2251,8 +2694,14 @@ class TagFinder:
         if choice == "" and default_choice:
             choice = default_choice
 
-        if choice.isdigit() and 0 <= int(choice) < len(adapters):
-            selected_adapter = adapters[int(choice)]
+        # Parse the choice once; anything that isn't a number selects nothing
+        try:
+            index = int(choice)
+        except ValueError:
+            index = -1
+
+        if 0 <= index < len(adapters):
+            selected_adapter = adapters[index]
             self.current_adapter = selected_adapter["address"]
             self.settings["adapter"] = self.current_adapter
 
@@ -2267,13 +2716,17 @@ class TagFinder:
 
             self._save_settings()
             self.console.print(
-                f"[bold green]Selected adapter: {adapters[int(choice)]['name']}[/]"
+                f"[bold green]Selected adapter: {selected_adapter['name']}[/]"
             )
 
     def generate_device_table(self, devices: Dict[str, Device]) -> Table:
         """Generate a table of devices for display"""
         # Create a responsive table that adapts to available space
 
+        # One timestamp for the whole frame
+        now = time.time()
+        new_device_timeout = NEW_DEVICE_TIMEOUT
+
         # Get current sort priority
         sort_priority = self.settings.get(
             "sort_priority", ["track_prob", "distance", "last_seen"]
@@ -2286,6 +2739,37 @@ class TagFinder:
             "signal": "Signal quality",
         }
 
+        # Reuse the last table if nothing it shows has changed. Device updates
+        # always move last_seen, and ages are displayed to the second.
+        device_ids = self.device_ids
+        fingerprint = (
+            tuple(sort_priority),
+            self.selected_device,
+            self.selected_device in self.devices,
+            self.selection_mode,
+            self.cursor_position,
+            hasattr(self, "frozen_devices"),
+            self.airtag_only_mode,
+            self.console.width,
+            tuple(self.visible_columns.items()),
+            tuple(
+                (
+                    address,
+                    device_ids.get(address),
+                    device.last_seen,
+                    round(now - device.last_seen),
+                    device.is_new and now - device.first_seen <= new_device_timeout,
+                    device.distance,
+                )
+                for address, device in devices.items()
+            ),
+        )
+        if (
+            self._device_table_cache is not None
+            and self._device_table_cache[0] == fingerprint
+        ):
+            return self._device_table_cache[1]
+
         # Format sort priority for display
         sort_display = " → ".join([sort_names.get(p, p) for p in sort_priority])
 
@@ -2303,93 +2787,73 @@ class TagFinder:
             self.selected_device is not None and self.selected_device in self.devices
         )
 
+        # Resolve terminal width and column visibility once for the whole table
+        width = self.console.width
+        visible_columns = self.visible_columns
+        show_type = visible_columns.get("type", True)
+        show_mac = visible_columns.get("mac", True)
+        show_track_prob = visible_columns.get("track_prob", True)
+        # Manufacturer and last seen respect both space constraints and visibility
+        show_manufacturer = visible_columns.get("manufacturer", True) and (
+            not has_selected or width > 100
+        )
+        show_rssi = visible_columns.get("rssi", True)
+        show_signal = visible_columns.get("signal", True)
+        show_distance = visible_columns.get("distance", True)
+        show_last_seen = visible_columns.get("last_seen", True) and (
+            not has_selected or width > 120
+        )
+        show_details = visible_columns.get("details", True)
+
         # Add columns with responsive width settings - respect visibility settings
 
         # Name column is always visible (required for selection)
         table.add_column("Name", style="cyan", ratio=3, no_wrap=False)
 
         # Type column
-        if self.visible_columns.get("type", True):
+        if show_type:
             table.add_column("Type", ratio=2, no_wrap=False)
 
         # MAC address column
-        if self.visible_columns.get("mac", True):
+        if show_mac:
             table.add_column("MAC", ratio=1, no_wrap=False)
 
         # Tracker probability column
-        if self.visible_columns.get("track_prob", True):
+        if show_track_prob:
             table.add_column("Track Prob", justify="center", ratio=1)
 
-        # Manufacturer column - respect both space constraints and visibility
-        if self.visible_columns.get("manufacturer", True) and (
-            not has_selected or self.console.width > 100
-        ):
+        # Manufacturer column
+        if show_manufacturer:
             table.add_column("Manufacturer", ratio=1, no_wrap=False)
 
         # RSSI column
-        if self.visible_columns.get("rssi", True):
+        if show_rssi:
             table.add_column("RSSI", justify="right", ratio=1)
 
         # Signal column
-        if self.visible_columns.get("signal", True):
+        if show_signal:
             table.add_column("Signal", justify="right", ratio=1)  # Signal quality info
 
         # Distance column
-        if self.visible_columns.get("distance", True):
+        if show_distance:
             table.add_column("Distance", justify="right", ratio=1)
 
-        # Last seen column - respect both space constraints and visibility
-        if self.visible_columns.get("last_seen", True) and (
-            not has_selected or self.console.width > 120
-        ):
+        # Last seen column
+        if show_last_seen:
             table.add_column("Last Seen", justify="right", ratio=1)
 
         # Details column - respect both space constraints and visibility
-        if self.visible_columns.get("details", True):
-            if self.console.width > 140:
+        if show_details:
+            if width > 140:
                 table.add_column("Details", ratio=5, no_wrap=False)
             else:
                 table.add_column("Details", ratio=4, no_wrap=False)
 
-        # Create a sorting function based on current sort priority
-        def multi_sort_key(device):
-            # Get sort priority from settings or use default
-            sort_priority = self.settings.get(
-                "sort_priority", ["track_prob", "distance", "last_seen"]
-            )
-
-            # Initialize keys dictionary
-            keys = {}
-
-            # Tracker probability (convert confidence to numeric value, lower is higher confidence)
-            if device.is_airtag:
-                keys["track_prob"] = (
-                    device.tracker_confidence
-                )  # Lower values = higher confidence
-            else:
-                keys["track_prob"] = 999  # Non-trackers at bottom
-
-            # Distance (smaller values first)
-            keys["distance"] = device.distance if device.distance < 100 else 100
-
-            # Last seen (negative value puts most recent first)
-            keys["last_seen"] = -device.last_seen
-
-            # RSSI (stronger signal first)
-            keys["rssi"] = (
-                -device.smooth_rssi
-            )  # Negative RSSI value makes stronger signals first
+        # Only known sort keys take part in sorting
+        sort_keys = tuple(k for k in sort_priority if k in sort_names)
 
-            # Signal quality (higher quality first)
-            keys["signal"] = (
-                -device.signal_quality
-            )  # Negative value makes higher quality first
-
-            # Create a tuple of keys based on current sort priority
-            return tuple(keys[k] for k in sort_priority if k in keys)
-
-        # Sort devices by our multi-sort key
-        sorted_devices = sorted(devices.values(), key=multi_sort_key)
+        # Sort devices by the current sort priority
+        sorted_devices = _sort_devices(devices.values(), sort_keys)
 
         # For AirTag only mode, filter to only include actual AirTags or Find My devices
         if self.airtag_only_mode:
@@ -2416,7 +2880,7 @@ class TagFinder:
         ):
             # When in selection mode, we should use the same sorting but on frozen devices
             # to ensure consistent tab navigation
-            frozen_sorted = sorted(self.frozen_devices.values(), key=multi_sort_key)
+            frozen_sorted = _sort_devices(self.frozen_devices.values(), sort_keys)
             self.sorted_device_list = frozen_sorted
         else:
             self.sorted_device_list = sorted_devices
@@ -2450,7 +2914,7 @@ class TagFinder:
             distance = f"{device.distance:.2f}m" if device.distance < 100 else "Unknown"
 
             # Format last seen ago in a more human-readable way
-            time_since_last_seen = time.time() - device.last_seen
+            time_since_last_seen = now - device.last_seen
             if time_since_last_seen < 10:
                 seen_time = "Just now"
             elif time_since_last_seen < 60:
@@ -2469,31 +2933,18 @@ class TagFinder:
             else:
                 rssi_color = "red"
 
-            # Color code for AirTags and Find My devices based on confidence
-            tracker_type = (
-                device.get_tracker_type() if device.is_airtag else "Not a tracker"
-            )
-
             # Enhanced confidence-based color coding
             if device.is_airtag:
-                if hasattr(device, "tracker_confidence"):
-                    # Use confidence level for coloring
-                    if device.tracker_confidence == TRACKING_CONFIDENCE["CONFIRMED"]:
-                        name_color = "bright_red"  # Confirmed trackers in bright red
-                    elif device.tracker_confidence == TRACKING_CONFIDENCE["HIGH"]:
-                        name_color = "red"  # High confidence in regular red
-                    elif device.tracker_confidence == TRACKING_CONFIDENCE["MEDIUM"]:
-                        name_color = "yellow"  # Medium confidence in yellow
-                    else:
-                        name_color = "blue"  # Low confidence in blue
-                else:
-                    # Backward compatibility with older data
-                    if "Apple AirTag" in tracker_type:
-                        name_color = "bright_red"
-                    elif "Find My" in tracker_type:
-                        name_color = "yellow"
-                    else:
-                        name_color = "blue"
+                # Use confidence level for coloring
+                (
+                    name_color,
+                    indicator,
+                    indicator_style,
+                    tracker_prob,
+                    prob_color,
+                ) = CONFIDENCE_STYLE.get(
+                    device.tracker_confidence, _DEFAULT_CONFIDENCE_STYLE
+                )
             else:
                 name_color = "white"
 
@@ -2520,16 +2971,11 @@ class TagFinder:
             # Display detailed information without the seen time
             details = device.device_details if device.device_details else ""
 
-            # Format MAC address - just show last 6 characters for better readability
-            mac_display = (
-                device.address.split(":")[-3:]
-                if ":" in device.address
-                else device.address[-6:]
-            )
-            if isinstance(mac_display, list):
-                mac_display = ":".join(mac_display)
+            # Format MAC address - just show the last 3 octets for better readability
+            address = device.address
+            mac_display = address[-8:] if ":" in address else address[-6:]
 
-                # Get signal quality as a percentage and stability
+            # Get signal quality as a percentage and stability
             stability = device.signal_stability
 
             # Format signal with both quality and stability information
@@ -2543,21 +2989,14 @@ class TagFinder:
                 stability_label = "Unstable"
                 stability_suffix = "-"
 
-            signal_quality = f"{device.signal_quality:.0f}% {stability_suffix}"
+            quality = device.signal_quality
+            signal_quality = f"{quality:.0f}% {stability_suffix}"
 
             # Color code signal quality
-            if device.signal_quality > 70:
-                signal_color = "green"
-            elif device.signal_quality > 40:
-                signal_color = "yellow"
-            else:
-                signal_color = "red"
+            signal_color = _RISING_STYLES[bisect_left(_QUALITY_STYLE_BINS, quality)]
 
             # Create device name display with NEW indicator if needed (only within timeout period)
-            if (
-                getattr(device, "is_new", False)
-                and time.time() - device.first_seen <= NEW_DEVICE_TIMEOUT
-            ):
+            if device.is_new and now - device.first_seen <= new_device_timeout:
                 name_display = Text()
                 name_display.append(" NEW ", style="bold yellow on black")
                 name_display.append(
@@ -2568,35 +3007,10 @@ class TagFinder:
                     f"{idx_display} {device.name}", style=f"{name_color} {style}"
                 )
 
-            # Add tracking indicator based on confidence
-            if device.is_airtag and hasattr(device, "tracker_confidence"):
-                if device.tracker_confidence == TRACKING_CONFIDENCE["CONFIRMED"]:
-                    name_display.append(" ⚠️", style="bold bright_red")
-                elif device.tracker_confidence == TRACKING_CONFIDENCE["HIGH"]:
-                    name_display.append(" ⚠️", style="bold red")
-                elif device.tracker_confidence == TRACKING_CONFIDENCE["MEDIUM"]:
-                    name_display.append(" 🔍", style="bold yellow")
-                elif device.tracker_confidence == TRACKING_CONFIDENCE["LOW"]:
-                    name_display.append(" ?", style="bold blue")
-
-            # Calculate tracker probability display
-            tracker_prob_display = ""
+            # Add tracking indicator and probability based on confidence
             if device.is_airtag:
-                if device.tracker_confidence == TRACKING_CONFIDENCE["CONFIRMED"]:
-                    tracker_prob = "95-100%"
-                    prob_color = "bright_red"
-                elif device.tracker_confidence == TRACKING_CONFIDENCE["HIGH"]:
-                    tracker_prob = "75-95%"
-                    prob_color = "red"
-                elif device.tracker_confidence == TRACKING_CONFIDENCE["MEDIUM"]:
-                    tracker_prob = "50-75%"
-                    prob_color = "yellow"
-                elif device.tracker_confidence == TRACKING_CONFIDENCE["LOW"]:
-                    tracker_prob = "25-50%"
-                    prob_color = "blue"
-                else:
-                    tracker_prob = "< 25%"
-                    prob_color = "blue"
+                if indicator:
+                    name_display.append(indicator, style=indicator_style)
                 tracker_prob_display = Text(tracker_prob, style=f"bold {prob_color}")
             else:
                 tracker_prob_display = Text("0%", style="dim")
@@ -2605,41 +3019,37 @@ class TagFinder:
             row_data = [name_display]  # Name is always visible
 
             # Type column
-            if self.visible_columns.get("type", True):
+            if show_type:
                 row_data.append(device.device_type)
 
             # MAC column
-            if self.visible_columns.get("mac", True):
+            if show_mac:
                 row_data.append(mac_display)
 
             # Tracker probability column
-            if self.visible_columns.get("track_prob", True):
+            if show_track_prob:
                 row_data.append(tracker_prob_display)
 
-            # Manufacturer column - respect both space constraints and visibility
-            if self.visible_columns.get("manufacturer", True) and (
-                not has_selected or self.console.width > 100
-            ):
+            # Manufacturer column
+            if show_manufacturer:
                 row_data.append(device.manufacturer)
 
             # RSSI column
-            if self.visible_columns.get("rssi", True):
+            if show_rssi:
                 row_data.append(Text(rssi_str, style=f"{rssi_color} {style}"))
 
             # Signal column
-            if self.visible_columns.get("signal", True):
+            if show_signal:
                 row_data.append(
                     Text(f"{signal_quality}", style=f"{signal_color} {style}")
                 )
 
             # Distance column
-            if self.visible_columns.get("distance", True):
+            if show_distance:
                 row_data.append(distance)
 
-            # Last seen column - respect both space constraints and visibility
-            if self.visible_columns.get("last_seen", True) and (
-                not has_selected or self.console.width > 120
-            ):
+            # Last seen column
+            if show_last_seen:
                 # Color code last seen times
                 if time_since_last_seen < 30:
                     seen_style = "green"  # Very recent
@@ -2651,7 +3061,7 @@ class TagFinder:
                 row_data.append(Text(seen_time, style=f"{seen_style}"))
 
             # Details column
-            if self.visible_columns.get("details", True):
+            if show_details:
                 row_data.append(details)
 
             # Add the row with the correct data
@@ -2677,6 +3087,7 @@ class TagFinder:
         # Store the device map for index-based selection
         self.device_map = device_map
 
+        self._device_table_cache = (fingerprint, table)
         return table
 
     def generate_header(self) -> Panel:
@@ -2779,122 +3190,114 @@ class TagFinder:
         """Generate detail panel for selected device"""
         # Create a text object to build up the details panel
         details_text = Text()
-        details_text.append("\n")  # Start with a newline for spacing
+        append = details_text.append
+        append("\n")  # Start with a newline for spacing
+
+        # One timestamp for the whole panel
+        now = time.time()
 
         # Show NEW badge if this is a newly discovered device AND within timeout period
-        if getattr(device, "is_new", False) and (
-            time.time() - device.first_seen <= NEW_DEVICE_TIMEOUT
-        ):
-            details_text.append("🆕 ", style="bold yellow")
-            details_text.append("NEWLY DISCOVERED DEVICE", style="bold yellow")
+        if device.is_new and (now - device.first_seen <= NEW_DEVICE_TIMEOUT):
+            append("🆕 ", style="bold yellow")
+            append("NEWLY DISCOVERED DEVICE", style="bold yellow")
             # Also show when it was first seen
-            details_text.append("\n")
-            time_ago = format_time_ago(time.time() - device.first_seen)
-            details_text.append(f"First seen {time_ago} ago", style="yellow")
-            details_text.append("\n")
+            append("\n")
+            time_ago = format_time_ago(now - device.first_seen)
+            append(f"First seen {time_ago} ago", style="yellow")
+            append("\n")
 
         # Basic Device Info section
-        details_text.append("◉ ", style="bold green")
-        details_text.append("Basic Info", style="bold yellow")
-        details_text.append("\n")
+        append("◉ ", style="bold green")
+        append("Basic Info", style="bold yellow")
+        append("\n")
 
-        details_text.append(f"  Name: ", style="bold")
-        details_text.append(f"{device.name or 'Unknown'}\n")
+        append(f"  Name: ", style="bold")
+        append(f"{device.name or 'Unknown'}\n")
 
-        details_text.append(f"  Address: ", style="bold")
-        details_text.append(f"{device.address}\n")
+        append(f"  Address: ", style="bold")
+        append(f"{device.address}\n")
 
-        details_text.append(f"  Manufacturer: ", style="bold")
-        details_text.append(f"{device.manufacturer}\n")
+        append(f"  Manufacturer: ", style="bold")
+        append(f"{device.manufacturer}\n")
 
-        details_text.append(f"  Device Type: ", style="bold")
-        details_text.append(f"{device.device_type}\n")
+        append(f"  Device Type: ", style="bold")
+        append(f"{device.device_type}\n")
 
         # Add tracker identification if it's a tracking device
         if device.is_airtag:
             tracker_type = device.get_tracker_type()
 
-            # Get confidence level if available
-            confidence_level = "Unknown"
-            confidence_style = "bold red"
-
-            if hasattr(device, "tracker_confidence"):
-                confidence_levels = {
-                    TRACKING_CONFIDENCE["CONFIRMED"]: ("Confirmed", "bold bright_red"),
-                    TRACKING_CONFIDENCE["HIGH"]: ("High Confidence", "bold red"),
-                    TRACKING_CONFIDENCE["MEDIUM"]: ("Medium Confidence", "bold yellow"),
-                    TRACKING_CONFIDENCE["LOW"]: ("Low Confidence", "bold blue"),
-                    TRACKING_CONFIDENCE["UNLIKELY"]: ("Unlikely", "bold blue"),
-                }
-                confidence_level, confidence_style = confidence_levels.get(
-                    device.tracker_confidence, ("Unknown", "bold red")
-                )
+            # Get confidence level
+            confidence_levels = {
+                TRACKING_CONFIDENCE["CONFIRMED"]: ("Confirmed", "bold bright_red"),
+                TRACKING_CONFIDENCE["HIGH"]: ("High Confidence", "bold red"),
+                TRACKING_CONFIDENCE["MEDIUM"]: ("Medium Confidence", "bold yellow"),
+                TRACKING_CONFIDENCE["LOW"]: ("Low Confidence", "bold blue"),
+                TRACKING_CONFIDENCE["UNLIKELY"]: ("Unlikely", "bold blue"),
+            }
+            confidence_level, confidence_style = confidence_levels.get(
+                device.tracker_confidence, ("Unknown", "bold red")
+            )
 
-            details_text.append(f"  Tracker Type: ", style="bold red")
-            details_text.append(f"{tracker_type}\n", style="bold red")
-            details_text.append(f"  Detection Confidence: ", style="bold")
-            details_text.append(f"{confidence_level}\n", style=confidence_style)
+            append(f"  Tracker Type: ", style="bold red")
+            append(f"{tracker_type}\n", style="bold red")
+            append(f"  Detection Confidence: ", style="bold")
+            append(f"{confidence_level}\n", style=confidence_style)
 
         # Signal Information section
-        details_text.append("\n◉ ", style="bold green")
-        details_text.append("Signal Data", style="bold yellow")
-        details_text.append("\n")
+        append("\n◉ ", style="bold green")
+        append("Signal Data", style="bold yellow")
+        append("\n")
 
-        details_text.append(f"  Current RSSI: ", style="bold")
+        append(f"  Current RSSI: ", style="bold")
         # Color code based on signal strength
-        rssi_style = (
-            "green" if device.rssi > -70 else "yellow" if device.rssi > -85 else "red"
-        )
-        details_text.append(f"{device.rssi} dBm\n", style=rssi_style)
+        rssi_style = _RISING_STYLES[bisect_left(_RSSI_STYLE_BINS, device.rssi)]
+        append(f"{device.rssi} dBm\n", style=rssi_style)
 
-        details_text.append(f"  Smoothed RSSI: ", style="bold")
-        smooth_rssi_style = (
-            "green"
-            if device.smooth_rssi > -70
-            else "yellow" if device.smooth_rssi > -85 else "red"
-        )
-        details_text.append(f"{device.smooth_rssi:.1f} dBm\n", style=smooth_rssi_style)
+        append(f"  Smoothed RSSI: ", style="bold")
+        smooth_rssi_style = _RISING_STYLES[
+            bisect_left(_RSSI_STYLE_BINS, device.smooth_rssi)
+        ]
+        append(f"{device.smooth_rssi:.1f} dBm\n", style=smooth_rssi_style)
 
-        details_text.append(f"  Signal Quality: ", style="bold")
+        append(f"  Signal Quality: ", style="bold")
         quality = device.signal_quality
-        quality_style = "green" if quality > 70 else "yellow" if quality > 40 else "red"
-        details_text.append(f"{quality:.1f}%\n", style=quality_style)
+        quality_style = _RISING_STYLES[bisect_left(_QUALITY_STYLE_BINS, quality)]
+        append(f"{quality:.1f}%\n", style=quality_style)
 
-        details_text.append(f"  Signal Stability: ", style="bold")
+        append(f"  Signal Stability: ", style="bold")
         stability = device.signal_stability
-        stability_style = (
-            "green" if stability < 3 else "yellow" if stability < 6 else "red"
-        )
-        details_text.append(f"{stability:.1f}\n", style=stability_style)
+        stability_style = _FALLING_STYLES[
+            bisect_right(_STABILITY_STYLE_BINS, stability)
+        ]
+        append(f"{stability:.1f}\n", style=stability_style)
 
         # Distance Estimation section
-        details_text.append("\n◉ ", style="bold green")
-        details_text.append("Distance & Proximity Tracking", style="bold yellow")
-        details_text.append("\n")
+        append("\n◉ ", style="bold green")
+        append("Distance & Proximity Tracking", style="bold yellow")
+        append("\n")
 
-        details_text.append(f"  Estimated Distance: ", style="bold")
+        append(f"  Estimated Distance: ", style="bold")
         distance = device.distance
         distance_label = f"{distance:.2f} meters"
         if distance < 1:
             distance_label += f" ({distance * 100:.0f} cm)"
-        distance_style = (
-            "green" if distance < 2 else "yellow" if distance < 5 else "red"
-        )
-        details_text.append(f"{distance_label}\n", style=distance_style)
+        distance_style = _FALLING_STYLES[bisect_right(_DISTANCE_STYLE_BINS, distance)]
+        append(f"{distance_label}\n", style=distance_style)
 
         # Add proximity tracking - start tracking if not already tracking
         if device.previous_distance is None:
             # Initialize tracking
             device.previous_distance = device.distance
-            device.last_trend_update = time.time()
-            details_text.append(f"  Proximity Trend: ", style="bold")
-            details_text.append("Initializing tracking...\n", style="yellow")
+            device.last_trend_update = now
+            append(f"  Proximity Trend: ", style="bold")
+            append("Initializing tracking...\n", style="yellow")
         else:
             # Update trend and display it
             trend_direction, change_rate = device.update_proximity_trend()
             trend_summary = device.get_trend_summary()
 
-            details_text.append(f"  Proximity Trend: ", style="bold")
+            append(f"  Proximity Trend: ", style="bold")
 
             if trend_direction == "closer":
                 trend_style = "green"
@@ -2906,102 +3309,98 @@ class TagFinder:
                 trend_style = "yellow"
                 trend_icon = "◆"  # Diamond for stable
 
-            details_text.append(f"{trend_icon} {trend_summary}\n", style=trend_style)
+            append(f"{trend_icon} {trend_summary}\n", style=trend_style)
 
-        details_text.append(f"  Calibration Values: ", style="bold")
-        details_text.append(
+        append(f"  Calibration Values: ", style="bold")
+        append(
             f"N={device.calibrated_n_value:.2f}, RSSI@1m={device.calibrated_rssi_at_one_meter}\n"
         )
 
         # Time Information section
-        details_text.append("\n◉ ", style="bold green")
-        details_text.append("Timing Information", style="bold yellow")
-        details_text.append("\n")
+        append("\n◉ ", style="bold green")
+        append("Timing Information", style="bold yellow")
+        append("\n")
 
-        details_text.append(f"  First Seen: ", style="bold")
-        first_seen_ago = time.time() - device.first_seen
-        details_text.append(
+        append(f"  First Seen: ", style="bold")
+        first_seen_ago = now - device.first_seen
+        append(
             f"{time.strftime('%H:%M:%S', time.localtime(device.first_seen))} "
             f"({format_time_ago(first_seen_ago)})\n"
         )
 
-        details_text.append(f"  Last Seen: ", style="bold")
-        last_seen_ago = time.time() - device.last_seen
-        details_text.append(
+        append(f"  Last Seen: ", style="bold")
+        last_seen_ago = now - device.last_seen
+        append(
             f"{time.strftime('%H:%M:%S', time.localtime(device.last_seen))} "
             f"({format_time_ago(last_seen_ago)})\n"
         )
 
-        details_text.append(f"  Tracked Duration: ", style="bold")
-        details_text.append(f"{format_time_ago(device.seen_duration)}\n")
+        append(f"  Tracked Duration: ", style="bold")
+        append(f"{format_time_ago(device.seen_duration)}\n")
 
         # Technical Details section
-        details_text.append("\n◉ ", style="bold green")
-        details_text.append("Technical Details", style="bold yellow")
-        details_text.append("\n")
+        append("\n◉ ", style="bold green")
+        append("Technical Details", style="bold yellow")
+        append("\n")
 
         # Service UUIDs with improved Find My detection
         if device.service_uuids:
             truncated = len(device.service_uuids) > 5
             service_uuids = device.service_uuids[:5]  # Limit to first 5 UUIDs
-            details_text.append(f"  Service UUIDs: ", style="bold")
+            append(f"  Service UUIDs: ", style="bold")
             for i, uuid in enumerate(service_uuids):
                 if i > 0:
-                    details_text.append(", ")
+                    append(", ")
                 # Highlight known tracking UUIDs in red
-                if any(known_uuid in uuid.upper() for known_uuid in FIND_MY_UUIDS):
-                    details_text.append(uuid, style="bold red")
+                if _FIND_MY_RE.search(uuid.upper()):
+                    append(uuid, style="bold red")
                 else:
-                    details_text.append(uuid)
+                    append(uuid)
             if truncated:
-                details_text.append(f" +{len(device.service_uuids) - 5} more")
-            details_text.append("\n")
+                append(f" +{len(device.service_uuids) - 5} more")
+            append("\n")
 
         # Manufacturer Data with improved Find My detection
         if device.manufacturer_data:
-            details_text.append(f"  Manufacturer Data: ", style="bold")
+            append(f"  Manufacturer Data: ", style="bold")
             mfg_data_entries = []
-            for company_id, data in device.manufacturer_data.items():
-                if company_id in COMPANY_IDENTIFIERS:
-                    company_name = COMPANY_IDENTIFIERS[company_id]
-                    # Highlight Apple data
-                    if company_id == 0x004C:  # Apple
-                        mfg_data_str = f"{company_name} (0x{company_id:04X}): "
-                        # Check if this is Find My data
-                        if len(data) > 1 and (data[0] == 0x12 and data[1] == 0x19):
-                            mfg_data_str += f"[bold red]{data.hex()[:16]}[/bold red]"
-                        else:
-                            mfg_data_str += f"{data.hex()[:16]}"
-                    else:
-                        mfg_data_str = (
-                            f"{company_name} (0x{company_id:04X}): {data.hex()[:16]}"
-                        )
-
-                    if len(data.hex()) > 16:
-                        mfg_data_str += "..."
-                    mfg_data_entries.append(mfg_data_str)
+            # Only the first two entries are shown, and only their first 8 bytes
+            for company_id, data in islice(device.manufacturer_data.items(), 2):
+                company_hex = f"0x{company_id:04X}"
+                hex_data = data[:8].hex()
+                ellipsis = "..." if len(data) > 8 else ""
+                company_name = COMPANY_IDENTIFIERS.get(company_id)
+                if company_name is None:
+                    mfg_data_str = f"{company_hex}: {hex_data}{ellipsis}"
+                # Highlight Apple Find My data
+                elif company_id == 0x004C and data.startswith(_FIND_MY_PREFIX):
+                    mfg_data_str = (
+                        f"{company_name} ({company_hex}): "
+                        f"[bold red]{hex_data}[/bold red]{ellipsis}"
+                    )
                 else:
-                    mfg_data_str = f"0x{company_id:04X}: {data.hex()[:16]}"
-                    if len(data.hex()) > 16:
-                        mfg_data_str += "..."
-                    mfg_data_entries.append(mfg_data_str)
+                    mfg_data_str = (
+                        f"{company_name} ({company_hex}): {hex_data}{ellipsis}"
+                    )
+                mfg_data_entries.append(mfg_data_str)
 
-            details_text.append(", ".join(mfg_data_entries[:2]))
-            if len(mfg_data_entries) > 2:
-                details_text.append(f" +{len(mfg_data_entries) - 2} more")
-            details_text.append("\n")
+            append(", ".join(mfg_data_entries))
+            entry_count = len(device.manufacturer_data)
+            if entry_count > 2:
+                append(f" +{entry_count - 2} more")
+            append("\n")
 
         # Additional Details
         if device.device_details:
-            details_text.append(f"  Additional Details: ", style="bold")
-            details_text.append(f"{device.device_details}\n")
+            append(f"  Additional Details: ", style="bold")
+            append(f"{device.device_details}\n")
 
         # Actions Section
-        details_text.append("\n◉ ", style="bold green")
-        details_text.append("Available Actions", style="bold yellow")
-        details_text.append("\n")
-        details_text.append("  [b] ", style="bold cyan")
-        details_text.append("Back to device list\n")
+        append("\n◉ ", style="bold green")
+        append("Available Actions", style="bold yellow")
+        append("\n")
+        append("  [b] ", style="bold cyan")
+        append("Back to device list\n")
 
         # Return the details panel
         return Panel(
@@ -3057,66 +3456,64 @@ class TagFinder:
 
     def _show_overall_summary(self, unique_devices):
         """Show overall statistics and analytics for all devices"""
-        # Count and categorize
-        total_devices = len(unique_devices)
-        airtags = [d for d in unique_devices.values() if d.get("is_airtag", False)]
-        strongest_signal = min(d["rssi"] for d in unique_devices.values())
-        closest_device = [
-            d for d in unique_devices.values() if d["rssi"] == strongest_signal
-        ][0]
-
-        # Find average, min, max distances
-        distances = [
-            d.get("distance", float("inf"))
-            for d in unique_devices.values()
-            if isinstance(d.get("distance"), (int, float)) and d.get("distance") < 100
-        ]
-
-        avg_distance = sum(distances) / len(distances) if distances else 0
-        min_distance = min(distances) if distances else 0
-        max_distance = max(distances) if distances else 0
+        now = time.time()
 
-        # Device type statistics
-        device_types = {}
-        manufacturers = {}
+        # Count and categorize all devices in a single pass
+        total_devices = len(unique_devices)
+        airtags = []
+        closest_device = None  # First device with the lowest RSSI
+        distance_count = 0
+        distance_sum = 0
+        min_distance = 0
+        max_distance = 0
+        device_types = Counter()
+        manufacturers = Counter()
+        first_seen = None
+        recent_count = 0  # Devices active within the last 5 minutes
 
         for device in unique_devices.values():
-            device_type = device.get("device_type", "Unknown")
-            if device_type in device_types:
-                device_types[device_type] += 1
-            else:
-                device_types[device_type] = 1
-
-            manufacturer = device.get("manufacturer", "Unknown")
-            if manufacturer in manufacturers:
-                manufacturers[manufacturer] += 1
-            else:
-                manufacturers[manufacturer] = 1
-
-        # Sort by frequency
-        top_types = sorted(device_types.items(), key=lambda x: x[1], reverse=True)[:5]
-        top_manufacturers = sorted(
-            manufacturers.items(), key=lambda x: x[1], reverse=True
-        )[:5]
-
-        # Time-based statistics
-        now = time.time()
-        first_seen = min(d.get("first_seen", now) for d in unique_devices.values())
+            get = device.get
+            if get("is_airtag", False):
+                airtags.append(device)
+            if closest_device is None or device["rssi"] < closest_device["rssi"]:
+                closest_device = device
+
+            # Average, min, max of the known distances
+            distance = get("distance")
+            if isinstance(distance, (int, float)) and distance < 100:
+                if distance_count == 0:
+                    min_distance = max_distance = distance
+                else:
+                    min_distance = min(min_distance, distance)
+                    max_distance = max(max_distance, distance)
+                distance_count += 1
+                distance_sum += distance
+
+            # Device type statistics
+            device_types[get("device_type", "Unknown")] += 1
+            manufacturers[get("manufacturer", "Unknown")] += 1
+
+            # Time-based statistics
+            device_first_seen = get("first_seen", now)
+            if first_seen is None or device_first_seen < first_seen:
+                first_seen = device_first_seen
+            if now - get("last_seen", 0) < 300:  # 5 minutes
+                recent_count += 1
+
+        strongest_signal = closest_device["rssi"]
+        avg_distance = distance_sum / distance_count if distance_count else 0
         scan_duration = now - first_seen
 
-        # Recently active devices (within last 5 minutes)
-        recent_devices = [
-            d
-            for d in unique_devices.values()
-            if now - d.get("last_seen", 0) < 300  # 5 minutes
-        ]
+        # Sort by frequency
+        top_types = device_types.most_common(5)
+        top_manufacturers = manufacturers.most_common(5)
 
         # Display summary
         summary_text = [
             f"[bold cyan]Basic Statistics:[/]",
             f"[bold]Total unique devices:[/] {total_devices}",
             f"[bold]AirTags/Find My devices:[/] {len(airtags)}",
-            f"[bold]Recently active devices:[/] {len(recent_devices)}",
+            f"[bold]Recently active devices:[/] {recent_count}",
             f"[bold]Scan duration:[/] {scan_duration:.1f} seconds",
             "",
             f"[bold cyan]Proximity Analysis:[/]",
@@ -3228,31 +3625,28 @@ class TagFinder:
 
         # Add rows
         device_map = {}
-        for i, (addr, device) in enumerate(
-            sorted(
-                unique_devices.items(),
-                key=lambda x: x[1].get("rssi", -999),
-                reverse=True,
-            )
-        ):
-            if i >= 30:  # Limit to top 30 devices to avoid overflow
-                break
-
+        now = time.time()
+        # Limit to the 30 strongest devices to avoid overflow
+        strongest = heapq.nlargest(
+            30, unique_devices.items(), key=lambda x: x[1].get("rssi", -999)
+        )
+        for i, (addr, device) in enumerate(strongest):
             device_id = i + 1
             device_map[device_id] = addr
 
-            name = device.get("name", "Unknown")
-            device_type = device.get("device_type", "BLE Device")
-            manufacturer = device.get("manufacturer", "Unknown")
-            rssi = device.get("rssi", "N/A")
+            get = device.get
+            name = get("name", "Unknown")
+            device_type = get("device_type", "BLE Device")
+            manufacturer = get("manufacturer", "Unknown")
+            rssi = get("rssi", "N/A")
 
             # Format last seen time
-            last_seen = device.get("last_seen", time.time())
-            last_seen_ago = time.time() - last_seen
+            last_seen = get("last_seen", now)
+            last_seen_ago = now - last_seen
             last_seen_str = format_time_ago(last_seen_ago) + " ago"
 
             # Highlight AirTags/trackers
-            row_style = "bold red" if device.get("is_airtag", False) else ""
+            row_style = "bold red" if get("is_airtag", False) else ""
 
             table.add_row(
                 str(device_id),
@@ -3296,7 +3690,12 @@ class TagFinder:
         # Create a Device object from the dictionary if it's in dictionary form
         if isinstance(device_data, dict):
             try:
-                device = Device.from_dict(device_data)
+                # Reuse the Device built for this entry the last time it was shown
+                cache_key = (device_data["address"], device_data["last_seen"])
+                device = self._device_cache.get(cache_key)
+                if device is None:
+                    device = Device.from_dict(device_data)
+                    self._device_cache[cache_key] = device
             except Exception as e:
                 # If conversion fails, work with the raw dictionary
                 self.console.print(
@@ -3313,214 +3712,204 @@ class TagFinder:
 
         # Create a rich text object for the detailed info
         details_text = Text()
+        append = details_text.append
+
+        # One timestamp for the whole view
+        now = time.time()
 
         # Show a special header for new devices
-        is_new = getattr(device, "is_new", False)
-        is_within_timeout = time.time() - device.first_seen <= NEW_DEVICE_TIMEOUT
+        is_new = device.is_new
+        is_within_timeout = now - device.first_seen <= NEW_DEVICE_TIMEOUT
 
         if is_new and is_within_timeout:
             # Add a prominent header for new devices
-            details_text.append("\n")
-            details_text.append("█▓▒░ ", style="bold yellow")
-            details_text.append("NEW DEVICE DETECTED", style="bold yellow")
-            details_text.append(" ░▒▓█", style="bold yellow")
-            details_text.append("\n")
+            append("\n")
+            append("█▓▒░ ", style="bold yellow")
+            append("NEW DEVICE DETECTED", style="bold yellow")
+            append(" ░▒▓█", style="bold yellow")
+            append("\n")
 
             # Show when the device was first discovered
-            time_since_discovery = time.time() - device.first_seen
-            details_text.append(
+            time_since_discovery = now - device.first_seen
+            append(
                 f"First discovered {format_time_ago(time_since_discovery)} ago",
                 style="yellow",
             )
-            details_text.append("\n\n")
+            append("\n\n")
 
         # Device Identification Section
-        details_text.append("\n◉ ", style="bold green")
-        details_text.append("Device Identification", style="bold yellow")
-        details_text.append("\n\n")
+        append("\n◉ ", style="bold green")
+        append("Device Identification", style="bold yellow")
+        append("\n\n")
 
-        details_text.append(f"Name: ", style="bold")
-        details_text.append(f"{device.name or 'Unknown'}\n")
+        append(f"Name: ", style="bold")
+        append(f"{device.name or 'Unknown'}\n")
 
-        details_text.append(f"Address: ", style="bold")
-        details_text.append(f"{device.address}\n")
+        append(f"Address: ", style="bold")
+        append(f"{device.address}\n")
 
-        details_text.append(f"Device Type: ", style="bold")
-        details_text.append(f"{device.device_type}\n")
+        append(f"Device Type: ", style="bold")
+        append(f"{device.device_type}\n")
 
-        details_text.append(f"Manufacturer: ", style="bold")
-        details_text.append(f"{device.manufacturer}\n")
+        append(f"Manufacturer: ", style="bold")
+        append(f"{device.manufacturer}\n")
 
-        details_text.append(f"Detection Status: ", style="bold")
+        append(f"Detection Status: ", style="bold")
         if is_new:
             if is_within_timeout:
-                details_text.append("NEWLY DISCOVERED", style="bold yellow")
+                append("NEWLY DISCOVERED", style="bold yellow")
             else:
-                details_text.append("Previously discovered", style="blue")
+                append("Previously discovered", style="blue")
         else:
-            details_text.append("Previously known", style="blue")
-        details_text.append("\n")
+            append("Previously known", style="blue")
+        append("\n")
 
         # Add tracker identification if it's a tracking device
         if device.is_airtag:
             tracker_type = device.get_tracker_type()
 
-            # Get confidence level if available
-            confidence_level = "Unknown"
-            alert_style = "bold white on red"
-
-            if hasattr(device, "tracker_confidence"):
-                confidence_levels = {
-                    TRACKING_CONFIDENCE["CONFIRMED"]: (
-                        "CONFIRMED",
-                        "bold white on red",
-                    ),
-                    TRACKING_CONFIDENCE["HIGH"]: (
-                        "HIGH CONFIDENCE",
-                        "bold white on red",
-                    ),
-                    TRACKING_CONFIDENCE["MEDIUM"]: (
-                        "MEDIUM CONFIDENCE",
-                        "bold black on yellow",
-                    ),
-                    TRACKING_CONFIDENCE["LOW"]: (
-                        "LOW CONFIDENCE",
-                        "bold white on blue",
-                    ),
-                    TRACKING_CONFIDENCE["UNLIKELY"]: ("UNLIKELY", "bold white on blue"),
-                }
-                confidence_level, alert_style = confidence_levels.get(
-                    device.tracker_confidence, ("Unknown", "bold white on red")
-                )
+            # Get confidence level
+            confidence_levels = {
+                TRACKING_CONFIDENCE["CONFIRMED"]: (
+                    "CONFIRMED",
+                    "bold white on red",
+                ),
+                TRACKING_CONFIDENCE["HIGH"]: (
+                    "HIGH CONFIDENCE",
+                    "bold white on red",
+                ),
+                TRACKING_CONFIDENCE["MEDIUM"]: (
+                    "MEDIUM CONFIDENCE",
+                    "bold black on yellow",
+                ),
+                TRACKING_CONFIDENCE["LOW"]: (
+                    "LOW CONFIDENCE",
+                    "bold white on blue",
+                ),
+                TRACKING_CONFIDENCE["UNLIKELY"]: ("UNLIKELY", "bold white on blue"),
+            }
+            confidence_level, alert_style = confidence_levels.get(
+                device.tracker_confidence, ("Unknown", "bold white on red")
+            )
 
-            details_text.append("\n")
+            append("\n")
             if device.tracker_confidence <= TRACKING_CONFIDENCE["HIGH"]:
-                details_text.append(
+                append(
                     f"⚠️  TRACKING DEVICE DETECTED - {confidence_level}  ⚠️",
                     style=alert_style,
                 )
             else:
-                details_text.append(
+                append(
                     f"🔍  POSSIBLE TRACKING DEVICE - {confidence_level}  🔍",
                     style=alert_style,
                 )
-            details_text.append("\n")
-            details_text.append(f"Tracker Type: ", style="bold red")
-            details_text.append(f"{tracker_type}\n", style="bold red")
+            append("\n")
+            append(f"Tracker Type: ", style="bold red")
+            append(f"{tracker_type}\n", style="bold red")
 
         # Signal Information Section
-        details_text.append("\n◉ ", style="bold green")
-        details_text.append("Signal Information", style="bold yellow")
-        details_text.append("\n\n")
+        append("\n◉ ", style="bold green")
+        append("Signal Information", style="bold yellow")
+        append("\n\n")
 
-        details_text.append(f"RSSI Value: ", style="bold")
-        rssi_style = (
-            "green" if device.rssi > -70 else "yellow" if device.rssi > -85 else "red"
-        )
-        details_text.append(f"{device.rssi} dBm\n", style=rssi_style)
+        append(f"RSSI Value: ", style="bold")
+        rssi_style = _RISING_STYLES[bisect_left(_RSSI_STYLE_BINS, device.rssi)]
+        append(f"{device.rssi} dBm\n", style=rssi_style)
 
-        details_text.append(f"Signal Quality: ", style="bold")
+        append(f"Signal Quality: ", style="bold")
         quality = device.signal_quality
-        quality_style = "green" if quality > 70 else "yellow" if quality > 40 else "red"
-        details_text.append(f"{quality:.1f}%\n", style=quality_style)
+        quality_style = _RISING_STYLES[bisect_left(_QUALITY_STYLE_BINS, quality)]
+        append(f"{quality:.1f}%\n", style=quality_style)
 
-        details_text.append(f"Signal Stability: ", style="bold")
+        append(f"Signal Stability: ", style="bold")
         stability = device.signal_stability
-        stability_style = (
-            "green" if stability < 3 else "yellow" if stability < 6 else "red"
-        )
-        details_text.append(f"{stability:.1f}\n", style=stability_style)
+        stability_style = _FALLING_STYLES[
+            bisect_right(_STABILITY_STYLE_BINS, stability)
+        ]
+        append(f"{stability:.1f}\n", style=stability_style)
 
-        details_text.append(f"Estimated Distance: ", style="bold")
+        append(f"Estimated Distance: ", style="bold")
         distance = device.distance
         distance_label = f"{distance:.2f} meters"
         if distance < 1:
             distance_label += f" ({distance * 100:.0f} cm)"
-        distance_style = (
-            "green" if distance < 2 else "yellow" if distance < 5 else "red"
-        )
-        details_text.append(f"{distance_label}\n", style=distance_style)
+        distance_style = _FALLING_STYLES[bisect_right(_DISTANCE_STYLE_BINS, distance)]
+        append(f"{distance_label}\n", style=distance_style)
 
         # Time Information
-        details_text.append("\n◉ ", style="bold green")
-        details_text.append("Time Information", style="bold yellow")
-        details_text.append("\n\n")
+        append("\n◉ ", style="bold green")
+        append("Time Information", style="bold yellow")
+        append("\n\n")
 
-        details_text.append(f"First Seen: ", style="bold")
-        first_seen_ago = time.time() - device.first_seen
-        details_text.append(
+        append(f"First Seen: ", style="bold")
+        first_seen_ago = now - device.first_seen
+        append(
             f"{time.strftime('%H:%M:%S', time.localtime(device.first_seen))} "
             f"({format_time_ago(first_seen_ago)} ago)\n"
         )
 
-        details_text.append(f"Last Seen: ", style="bold")
-        last_seen_ago = time.time() - device.last_seen
-        details_text.append(
+        append(f"Last Seen: ", style="bold")
+        last_seen_ago = now - device.last_seen
+        append(
             f"{time.strftime('%H:%M:%S', time.localtime(device.last_seen))} "
             f"({format_time_ago(last_seen_ago)} ago)\n"
         )
 
-        details_text.append(f"Tracked Duration: ", style="bold")
-        details_text.append(f"{format_time_ago(device.seen_duration)}\n")
+        append(f"Tracked Duration: ", style="bold")
+        append(f"{format_time_ago(device.seen_duration)}\n")
 
         # Technical Details Section
-        details_text.append("\n◉ ", style="bold green")
-        details_text.append("Technical Details", style="bold yellow")
-        details_text.append("\n\n")
+        append("\n◉ ", style="bold green")
+        append("Technical Details", style="bold yellow")
+        append("\n\n")
 
         # Extract as many details as we can
         extracted_details = device.device_details
         if extracted_details:
-            details_text.append(f"Extracted Data: ", style="bold")
-            details_text.append(f"{extracted_details}\n")
+            append(f"Extracted Data: ", style="bold")
+            append(f"{extracted_details}\n")
 
         # Service UUIDs
         if device.service_uuids:
-            details_text.append(f"Service UUIDs: ", style="bold")
-            details_text.append("\n")
+            append(f"Service UUIDs: ", style="bold")
+            append("\n")
             for i, uuid in enumerate(device.service_uuids):
+                uuid_upper = uuid.upper()
                 # Highlight known tracking UUIDs in red
-                if any(known_uuid in uuid.upper() for known_uuid in FIND_MY_UUIDS):
-                    details_text.append(f"  {i+1}. {uuid}", style="bold red")
+                if _FIND_MY_RE.search(uuid_upper):
+                    append(f"  {i+1}. {uuid}", style="bold red")
                 else:
-                    details_text.append(f"  {i+1}. {uuid}")
+                    append(f"  {i+1}. {uuid}")
 
                 # Add service name if known
-                uuid_short = uuid[-4:].upper()
-                if uuid_short in DEVICE_TYPES:
-                    details_text.append(f" - {DEVICE_TYPES[uuid_short]}")
-                details_text.append("\n")
+                service_name = DEVICE_TYPES.get(uuid_upper[-4:])
+                if service_name:
+                    append(f" - {service_name}")
+                append("\n")
 
         # Manufacturer Data
         if device.manufacturer_data:
-            details_text.append(f"Manufacturer Data: ", style="bold")
-            details_text.append("\n")
+            append(f"Manufacturer Data: ", style="bold")
+            append("\n")
             for company_id, data in device.manufacturer_data.items():
                 company_name = COMPANY_IDENTIFIERS.get(
                     company_id, f"Unknown (0x{company_id:04X})"
                 )
-                details_text.append(f"  • {company_name}: ", style="bold")
+                append(f"  • {company_name}: ", style="bold")
 
                 # Show first 16 bytes with possible interpretation
                 hex_data = data.hex()
-                details_text.append(f"{hex_data}\n")
+                append(f"{hex_data}\n")
 
                 # Try to interpret the data
                 try:
                     if company_id == 0x004C:  # Apple
                         if len(data) >= 2:
-                            if data[0] == 0x12 and data[1] == 0x19:
-                                details_text.append(
-                                    "    ↳ Apple Find My Network Advertisement\n"
-                                )
-                            elif data[0] == 0x10:
-                                details_text.append("    ↳ Apple Watch Advertisement\n")
-                            elif data[0] == 0x07 and data[1] == 0x19:
-                                details_text.append(
-                                    "    ↳ AirPods Status Information\n"
-                                )
-                            elif data[0] == 0x02 and data[1] == 0x15:
-                                details_text.append("    ↳ iBeacon Advertisement\n")
+                            description = _APPLE_HEADER_DESCRIPTIONS.get(
+                                (data[0], data[1])
+                            ) or _APPLE_HEADER_DESCRIPTIONS.get((data[0], None))
+                            if description:
+                                append(f"    ↳ {description}\n")
                 except:
                     pass
 
@@ -3676,6 +4065,8 @@ class TagFinder:
         if hasattr(self, "selection_mode") and self.selection_mode:
             return
 
+        self._ui_dirty = True
+
         # Check if this is a new device for this scanning session
         is_new_device = device.address not in self.devices
 
@@ -3725,32 +4116,23 @@ class TagFinder:
         if 76 in advertisement_data.manufacturer_data:
             data = advertisement_data.manufacturer_data[76]
             # Look for Find My protocol signature
-            if len(data) > 1:
-                if (
-                    (data[0] == 0x12 and data[1] == 0x19)
-                    or data[0] == 0x10
-                    or data[0] == 0x0F
-                ):
-                    might_be_tracker = True
+            if len(data) > 1 and data.startswith(_TRACKER_ADV_PREFIXES):
+                might_be_tracker = True
 
         # Check for Find My UUIDs
         for uuid in advertisement_data.service_uuids:
-            uuid_upper = uuid.upper()
-            if any(find_my_id in uuid_upper for find_my_id in FIND_MY_UUIDS):
+            if _FIND_MY_RE.search(uuid.upper()):
                 might_be_tracker = True
                 break
 
         # Check for service data with Find My signatures
-        for service_uuid, _ in advertisement_data.service_data.items():
-            service_uuid_upper = service_uuid.upper()
-            if any(find_my_id in service_uuid_upper for find_my_id in FIND_MY_UUIDS):
+        for service_uuid in advertisement_data.service_data:
+            if _FIND_MY_RE.search(service_uuid.upper()):
                 might_be_tracker = True
                 break
 
         # Check if name contains tracker keywords
-        if device.name and any(
-            identifier in device.name.lower() for identifier in AIRTAG_IDENTIFIERS
-        ):
+        if device.name and _AIRTAG_NAME_RE.search(device.name.lower()):
             might_be_tracker = True
 
         # Always keep tracking devices, even with weak signals
@@ -4040,6 +4422,9 @@ class TagFinder:
                 "interval": scan_settings.get("interval", SCAN_PARAMETERS["interval"]),
                 "window": scan_settings.get("window", SCAN_PARAMETERS["window"]),
                 "passive": not scan_settings.get("active", SCAN_PARAMETERS["active"]),
+                # bleak asks BlueZ to drop duplicate reports by default, which stops
+                # RSSI and payload updates for devices already seen in active scans
+                "filters": {"DuplicateData": True},
             }
 
             # Use the specific adapter ID that was selected (or default to hci0)
@@ -4132,6 +4517,12 @@ class TagFinder:
                         },
                     ]
 
+                # Trackers broadcast everything in the advertisement itself, so in
+                # AirTag-only mode start with the kernel-filtered passive phase and
+                # only fall back to the active phases afterwards
+                if self.airtag_only_mode:
+                    scan_phases.sort(key=lambda phase: phase["mode"] != "passive")
+
             # Use Rich Live display for UI updates during all scanning phases
             # Increase refresh rate for more responsive real-time updates
             refresh_rate = 10  # Higher refresh rate (10 updates per second)
@@ -4227,10 +4618,13 @@ class TagFinder:
                                             and phase["mode"] == "passive"
                                         ):
                                             scanner_kwargs["bluez"]["passive"] = True
-                                            # Add required or_patterns for passive scanning
-                                            scanner_kwargs["bluez"][
-                                                "or_patterns"
-                                            ] = or_patterns
+                                            # Add required or_patterns for passive scanning,
+                                            # narrowed to tracker broadcasts in AirTag-only mode
+                                            scanner_kwargs["bluez"]["or_patterns"] = (
+                                                TRACKER_OR_PATTERNS
+                                                if self.airtag_only_mode
+                                                else or_patterns
+                                            )
                                         else:
                                             scanner_kwargs["bluez"]["passive"] = False
 
@@ -4253,10 +4647,12 @@ class TagFinder:
                                     # Create scanner without starting it yet
                                     try:
                                         scanner = BleakScanner(**scanner_kwargs)
-                                        # Start scanning explicitly
+                                        # Start scanning explicitly; it stays running for the
+                                        # whole phase and delivers advertisements through
+                                        # discovery_callback as they arrive
                                         await scanner.start()
-                                        self.last_scan_refresh = time.time()
                                         phase_start_time = time.time()
+                                        last_scan_refresh = phase_start_time
                                     except Exception as e:
                                         self.console.print(
                                             f"[yellow]Warning: Scanner initialization error: {e}. Trying next phase.[/]"
@@ -4275,14 +4671,17 @@ class TagFinder:
                                         )
                                     ):
                                         # Update UI
-                                        live.update(self._update_ui())
+                                        self._refresh_live(live)
 
                                         # Handle input processing
                                         await self._process_input()
 
-                                        # Periodically refresh the scan on Linux
+                                        # The DuplicateData filter only applies to active
+                                        # scans, so periodically restart passive scans to
+                                        # prevent device cache issues
                                         if (
-                                            time.time() - self.last_scan_refresh
+                                            phase["mode"] == "passive"
+                                            and time.time() - last_scan_refresh
                                             > SCAN_DURATION / 3
                                         ):
                                             try:
@@ -4292,19 +4691,18 @@ class TagFinder:
                                                     0.3
                                                 )  # Allow BlueZ to settle
                                                 await scanner.start()
-                                                self.last_scan_refresh = time.time()
                                             except Exception as e:
                                                 self.console.print(
                                                     f"[yellow]Scan refresh warning: {e}. Continuing.[/]",
                                                     end="\r",
                                                 )
-                                                self.last_scan_refresh = time.time()
                                                 # If scanner error, break this phase
                                                 if (
                                                     "not found" in str(e).lower()
                                                     or "error" in str(e).lower()
                                                 ):
                                                     scan_running = False
+                                            last_scan_refresh = time.time()
 
                                         # Watchdog - check if we're stuck in this phase for too long
                                         if (
@@ -4376,46 +4774,11 @@ class TagFinder:
                                             )
                                         ):
                                             # Update UI
-                                            live.update(self._update_ui())
+                                            self._refresh_live(live)
 
                                             # Handle input processing
                                             await self._process_input()
 
-                                            # Periodically refresh the scanner
-                                            if hasattr(self, "last_scan_refresh"):
-                                                time_since_refresh = (
-                                                    time.time() - self.last_scan_refresh
-                                                )
-                                                if (
-                                                    time_since_refresh
-                                                    > SCAN_DURATION / 3
-                                                ):
-                                                    try:
-                                                        # Restart scanner to prevent device cache issues
-                                                        await scanner.stop()
-                                                        await asyncio.sleep(0.3)
-                                                        await scanner.start()
-                                                        self.last_scan_refresh = (
-                                                            time.time()
-                                                        )
-                                                    except Exception as e:
-                                                        self.console.print(
-                                                            f"[yellow]Scan refresh warning: {e}. Continuing.[/]",
-                                                            end="\r",
-                                                        )
-                                                        self.last_scan_refresh = (
-                                                            time.time()
-                                                        )
-                                                        # If scanner error, break this phase
-                                                        if (
-                                                            "not found"
-                                                            in str(e).lower()
-                                                            or "error" in str(e).lower()
-                                                        ):
-                                                            scan_running = False
-                                            else:
-                                                self.last_scan_refresh = time.time()
-
                                             # Watchdog - check if we're stuck
                                             if (
                                                 time.time() - watchdog_timer
@@ -4461,7 +4824,7 @@ class TagFinder:
                         await asyncio.sleep(1.0)
 
                     # Update UI even if an error occurred
-                    live.update(self._update_ui())
+                    self._refresh_live(live)
 
                     # Always process input to ensure user can exit
                     await self._process_input()
@@ -4482,6 +4845,20 @@ class TagFinder:
                 await self.calibrate_device(self.devices[self.selected_device])
                 self.calibration_mode = False
 
+    def _refresh_live(self, live: Live):
+        """Rebuild the live display if anything changed since the last rebuild"""
+        now = time.monotonic()
+        # The proximity view tracks the selected device in real time, and the
+        # other views show ages in seconds, so refresh those at least once a second
+        if (
+            self._ui_dirty
+            or self.selected_device in self.devices
+            or now - self._last_ui_update >= 1.0
+        ):
+            live.update(self._update_ui())
+            self._ui_dirty = False
+            self._last_ui_update = now
+
     async def _process_input(self):
         """Process keyboard input non-blockingly"""
         # Clear input buffer if it's been more than 3 seconds since last keypress
@@ -4528,6 +4905,8 @@ class TagFinder:
 
     async def _handle_key_input(self, key):
         """Handle keyboard input during scanning"""
+        self._ui_dirty = True
+
         # Always handle these keys
         if key == "q":
             self.scanning = False
@@ -4640,6 +5019,9 @@ class TagFinder:
 
     def _update_ui(self) -> Layout:
         """Update the UI layout"""
+        # Terminal width for this frame's layout decisions
+        width = self.console.width
+
         if self.scanning:
             # Create scanning-specific layout
             scanning_layout = Layout()
@@ -4650,7 +5032,10 @@ class TagFinder:
                 and self.selection_mode
                 and not hasattr(self, "frozen_devices")
             ):
-                self.frozen_devices = copy.deepcopy(self.devices)
+                self.frozen_devices = {
+                    address: device.snapshot()
+                    for address, device in self.devices.items()
+                }
             # Clear frozen devices when exiting selection mode
             elif hasattr(self, "frozen_devices") and not (
                 hasattr(self, "selection_mode") and self.selection_mode
@@ -4751,10 +5136,7 @@ class TagFinder:
             proximity_info = ""
             if self.selected_device and self.selected_device in self.devices:
                 selected_device = self.devices[self.selected_device]
-                if (
-                    hasattr(selected_device, "distance_trend")
-                    and selected_device.distance_trend
-                ):
+                if selected_device.distance_trend:
                     _, _, trend, rate = selected_device.distance_trend[-1]
                     if trend == "closer":
                         proximity_info = (
@@ -4786,7 +5168,7 @@ class TagFinder:
 
                 # Format column visibility status in a compact way
             # Check terminal width to determine how many columns to use
-            if self.console.width > 100:
+            if width > 100:
                 # For wider terminals, use 3 columns
                 vis_col1 = column_status[:3]
                 vis_col2 = column_status[3:6]
@@ -4845,7 +5227,7 @@ class TagFinder:
             }
 
             # Choose display format based on available width
-            if self.console.width > 140:
+            if width > 140:
                 # For wide screens, use verbose format with priorities
                 sort_display = []
                 for i, key in enumerate(sort_priority[:3]):
@@ -4909,7 +5291,7 @@ class TagFinder:
             # Choose layout based on available width
             top_panel = Layout()
 
-            if self.console.width > 120:
+            if width > 120:
                 # For wide screens, use side-by-side layout
                 top_panel.split_row(
                     Layout(name="controls_panel", ratio=1),
@@ -5028,18 +5410,13 @@ class TagFinder:
                 selected_device = self.devices[self.selected_device]
 
                 # Make sure proximity tracking is initialized
-                if (
-                    not hasattr(selected_device, "previous_distance")
-                    or selected_device.previous_distance is None
-                ):
+                if selected_device.previous_distance is None:
                     selected_device.previous_distance = selected_device.distance
                     selected_device.last_trend_update = time.time()
 
                 # Optimize updates for selected device - update more frequently for selected devices
                 current_time = time.time()
-                elapsed_time = current_time - getattr(
-                    selected_device, "last_trend_update", 0
-                )
+                elapsed_time = current_time - selected_device.last_trend_update
 
                 # Update interval is shorter for proximity tracking (100ms instead of normal interval)
                 proximity_update_interval = 0.1  # 100ms for very responsive updates
@@ -5056,7 +5433,7 @@ class TagFinder:
             else:
                 # Normal layout when no device is selected
                 # Calculate the best panel height based on screen size and content
-                if self.console.width > 120:
+                if width > 120:
                     # For wider screens with side-by-side panels
                     min_height = max(
                         min_panel_height, 24
@@ -5117,18 +5494,13 @@ class TagFinder:
                 selected_device = self.devices[self.selected_device]
 
                 # Make sure proximity tracking is initialized
-                if (
-                    not hasattr(selected_device, "previous_distance")
-                    or selected_device.previous_distance is None
-                ):
+                if selected_device.previous_distance is None:
                     selected_device.previous_distance = selected_device.distance
                     selected_device.last_trend_update = time.time()
 
                 # Optimize updates for selected device in non-scanning mode too
                 current_time = time.time()
-                elapsed_time = current_time - getattr(
-                    selected_device, "last_trend_update", 0
-                )
+                elapsed_time = current_time - selected_device.last_trend_update
 
                 # Same optimized update interval for proximity tracking
                 proximity_update_interval = 0.1  # 100ms for very responsive updates
@@ -5189,6 +5561,12 @@ class TagFinder:
             if cmd == "q":
                 # Save any unsaved settings before exit
                 self._save_settings()
+                # Compact the history file on the way out
+                if self.history:
+                    try:
+                        self._compact_history()
+                    except Exception as e:
+                        self.console.print(f"[bold red]Error saving history: {e}[/]")
                 # Clear terminal before exit
                 self.console.clear()
                 break
@@ -6510,11 +6888,9 @@ class TagFinder:
             battery_info = device.device_details.split("Battery: ")[1].split("%")[0]
             try:
                 battery_level = int(battery_info)
-                battery_color = (
-                    "green"
-                    if battery_level > 50
-                    else "yellow" if battery_level > 20 else "red"
-                )
+                battery_color = _RISING_STYLES[
+                    bisect_left(_BATTERY_STYLE_BINS, battery_level)
+                ]
                 device_info_text.append(f"{battery_level}%\n", style=battery_color)
             except ValueError:
                 device_info_text.append(f"{battery_info}%\n")
@@ -6522,14 +6898,14 @@ class TagFinder:
         # Add signal quality information
         device_info_text.append(f"Signal Quality: ", style="bold")
         quality = device.signal_quality
-        quality_style = "green" if quality > 70 else "yellow" if quality > 40 else "red"
+        quality_style = _RISING_STYLES[bisect_left(_QUALITY_STYLE_BINS, quality)]
         device_info_text.append(f"{quality:.1f}%\n", style=quality_style)
 
         device_info_text.append(f"Signal Stability: ", style="bold")
         stability = device.signal_stability
-        stability_style = (
-            "green" if stability < 3 else "yellow" if stability < 6 else "red"
-        )
+        stability_style = _FALLING_STYLES[
+            bisect_right(_STABILITY_STYLE_BINS, stability)
+        ]
         device_info_text.append(f"{stability:.1f}\n", style=stability_style)
 
         # Add first seen information
@@ -6545,19 +6921,18 @@ class TagFinder:
             device_info_text.append(f"{tracker_type}\n", style="red")
 
             # Get confidence level
-            if hasattr(device, "tracker_confidence"):
-                confidence_levels = {
-                    TRACKING_CONFIDENCE["CONFIRMED"]: ("Confirmed", "bright_red"),
-                    TRACKING_CONFIDENCE["HIGH"]: ("High", "red"),
-                    TRACKING_CONFIDENCE["MEDIUM"]: ("Medium", "yellow"),
-                    TRACKING_CONFIDENCE["LOW"]: ("Low", "blue"),
-                    TRACKING_CONFIDENCE["UNLIKELY"]: ("Unlikely", "blue"),
-                }
-                confidence_level, confidence_style = confidence_levels.get(
-                    device.tracker_confidence, ("Unknown", "red")
-                )
-                device_info_text.append(f"Confidence: ", style="bold")
-                device_info_text.append(f"{confidence_level}\n", style=confidence_style)
+            confidence_levels = {
+                TRACKING_CONFIDENCE["CONFIRMED"]: ("Confirmed", "bright_red"),
+                TRACKING_CONFIDENCE["HIGH"]: ("High", "red"),
+                TRACKING_CONFIDENCE["MEDIUM"]: ("Medium", "yellow"),
+                TRACKING_CONFIDENCE["LOW"]: ("Low", "blue"),
+                TRACKING_CONFIDENCE["UNLIKELY"]: ("Unlikely", "blue"),
+            }
+            confidence_level, confidence_style = confidence_levels.get(
+                device.tracker_confidence, ("Unknown", "red")
+            )
+            device_info_text.append(f"Confidence: ", style="bold")
+            device_info_text.append(f"{confidence_level}\n", style=confidence_style)
 
         device_info_panel = Panel(
             device_info_text,
@@ -6618,21 +6993,15 @@ class TagFinder:
             gauge_text.append(f"RSSI: ", style="bold")
 
             # Color-code RSSI
-            rssi_style = (
-                "green"
-                if device.rssi > -70
-                else "yellow" if device.rssi > -85 else "red"
-            )
+            rssi_style = _RISING_STYLES[bisect_left(_RSSI_STYLE_BINS, device.rssi)]
             gauge_text.append(f"{device.rssi} dBm", style=rssi_style)
             gauge_text.append(f" (at {rssi_time})\n")
 
             # Add smoothed RSSI
             gauge_text.append(f"Smoothed RSSI: ", style="bold")
-            smooth_rssi_style = (
-                "green"
-                if device.smooth_rssi > -70
-                else "yellow" if device.smooth_rssi > -85 else "red"
-            )
+            smooth_rssi_style = _RISING_STYLES[
+                bisect_left(_RSSI_STYLE_BINS, device.smooth_rssi)
+            ]
             gauge_text.append(
                 f"{device.smooth_rssi:.1f} dBm\n", style=smooth_rssi_style
             )
@@ -6647,18 +7016,13 @@ class TagFinder:
             # Signal quality
             gauge_text.append(f"Quality: ", style="bold")
             quality = device.signal_quality
-            quality_style = (
-                "green" if quality > 70 else "yellow" if quality > 40 else "red"
-            )
+            quality_style = _RISING_STYLES[bisect_left(_QUALITY_STYLE_BINS, quality)]
             gauge_text.append(f"{quality:.1f}%\n\n", style=quality_style)
 
             # Show real-time distance changes with more detail
             gauge_text.append("Distance Trend\n", style="bold cyan")
 
-            if (
-                hasattr(device, "previous_distance")
-                and device.previous_distance is not None
-            ):
+            if device.previous_distance is not None:
                 delta = distance - device.previous_distance
                 if abs(delta) >= 0.01:  # Only show meaningful changes
                     delta_text = f"{abs(delta):.2f}m"
@@ -6693,12 +7057,14 @@ class TagFinder:
                     gauge_text.append(f"◆ Stable\n", style="bold yellow")
 
                 # Show historical distance changes if available
-                if (
-                    hasattr(device, "distance_trend")
-                    and len(device.distance_trend) >= 3
-                ):
+                if len(device.distance_trend) >= 3:
                     # Get last few distance points
-                    recent_distances = [d for _, d, _, _ in device.distance_trend[-3:]]
+                    recent_distances = [
+                        d
+                        for _, d, _, _ in islice(
+                            device.distance_trend, len(device.distance_trend) - 3, None
+                        )
+                    ]
                     gauge_text.append(f"Recent values: ", style="bold")
                     gauge_text.append(
                         f"{', '.join([f'{d:.2f}m' for d in recent_distances])}\n"
@@ -6900,7 +7266,7 @@ class TagFinder:
 
         # Add dynamic suggestions based on current trend and environment
         trend_direction = ""
-        if hasattr(device, "distance_trend") and device.distance_trend:
+        if device.distance_trend:
             _, _, direction, _ = device.distance_trend[-1]
             trend_direction = direction
 